@@ -6,6 +6,7 @@ from typing import List, Optional, Union
 from pydantic_settings import BaseSettings
 from pydantic import AnyHttpUrl, validator
 import os
+import tempfile
 
 
 class Settings(BaseSettings):
@@ -25,6 +26,15 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads"
     ALLOWED_EXTENSIONS: str = "pdf,doc,docx,xls,xlsx,ppt,pptx,txt,jpg,jpeg,png"
     
+    # Video conversion
+    VIDEO_MAX_CONCURRENT_CONVERSIONS: Optional[int] = None  # Defaults to the CPU count; when set, ffmpeg threads are split between jobs
+    VIDEO_MAX_UPLOAD_SIZE: int = 524288000  # 500MB
+    VIDEO_GPU_COUNT: int = 1  # CUDA devices NVENC jobs are spread across
+    VIDEO_CACHE_DIR: str = os.path.join(tempfile.gettempdir(), "video-conversion-cache")
+    VIDEO_CACHE_MAX_SIZE: int = 2147483648  # 2GB, 0 disables the cache
+    VIDEO_SPOOL_DIR: str = "/run/videoconv"  # RAM-backed (tmpfs) spool, used when the directory exists
+    VIDEO_SPOOL_DIR_MAX_SIZE: int = 536870912  # 512MB, larger uploads spool to the default temp dir
+    
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
     
@@ -42,6 +52,7 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
+    ACCESS_LOG: bool = False  # Per-request uvicorn access log lines under `python -m app.main`; the start commands pass --no-access-log
     
     # Monitoring
     PROMETHEUS_ENABLED: bool = True
@@ -0,0 +1,12 @@
+"""
+Application exceptions.
+"""
+
+
+class ConversionError(Exception):
+    """A conversion failed; rendered as a JSON error response with the given status."""
+    
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
@@ -3,12 +3,17 @@ Logging configuration.
 """
 
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
 import structlog
 from structlog.stdlib import LoggerFactory
 
+# Background thread that writes queued log records to stdout
+_log_listener: Optional[QueueListener] = None
+
 
 def setup_logging() -> None:
     """Setup structured logging."""
@@ -32,12 +37,31 @@ def setup_logging() -> None:
         cache_logger_on_first_use=True,
     )
     
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=logging.INFO,
-    )
+    # Configure standard library logging; records are only enqueued on the calling
+    # thread so a slow stdout never stalls the event loop
+    global _log_listener
+    if _log_listener is None:
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _log_listener.start()
+
+        # The queue handler renders the message before enqueueing, so it needs the format too
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(
+            level=logging.INFO,
+            handlers=[queue_handler],
+        )
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the writer thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 def get_logger(name: str) -> structlog.BoundLogger:
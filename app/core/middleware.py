@@ -0,0 +1,48 @@
+"""
+Request middleware.
+"""
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+
+
+class UploadSizeLimitMiddleware:
+    """Reject request bodies above a size limit for routes under a path prefix."""
+    
+    def __init__(self, app, path_prefix: str, max_body_size: int):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.max_body_size = max_body_size
+        self.detail = f"Request body exceeds the {max_body_size / (1024 * 1024):.0f}MB upload limit"
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        
+        # Refuse oversized uploads up front, before any of the body is read
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"detail": self.detail},
+            )
+            await response(scope, receive, send)
+            return
+        
+        # Enforce the limit while streaming too (chunked or lying clients)
+        received = 0
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=self.detail,
+                    )
+            return message
+        
+        await self.app(scope, limited_receive, send)
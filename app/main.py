@@ -5,13 +5,16 @@ Main FastAPI application entry point.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import structlog
 import uvicorn
 
 from app.core.config import settings
-from app.core.logging import setup_logging
+from app.core.exceptions import ConversionError
+from app.core.logging import setup_logging, shutdown_logging
+from app.core.middleware import UploadSizeLimitMiddleware
 from app.api.api import api_router
+from app.modules.video_converter.service import video_converter_service
 
 # Setup logging
 setup_logging()
@@ -43,6 +46,13 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS,
 )
 
+# Reject oversized video uploads before they are spooled
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    path_prefix=f"{settings.API_V1_STR}/video",
+    max_body_size=settings.VIDEO_MAX_UPLOAD_SIZE,
+)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -51,6 +61,7 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 async def startup_event():
     """Application startup event."""
     logger.info("Starting up FastAPI application")
+    await video_converter_service.warm_up()
     logger.info("Application startup completed")
 
 
@@ -58,6 +69,7 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event."""
     logger.info("Shutting down FastAPI application")
+    shutdown_logging()
 
 
 @app.get("/")
@@ -77,6 +89,15 @@ async def health_check():
     return {"status": "healthy", "version": settings.APP_VERSION}
 
 
+@app.exception_handler(ConversionError)
+async def conversion_exception_handler(request, exc: ConversionError):
+    """Render conversion failures reported by the services."""
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+    )
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
@@ -94,4 +115,7 @@ if __name__ == "__main__":
         port=8000,
         reload=settings.DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
+        loop="uvloop",
+        http="httptools",
+        access_log=settings.ACCESS_LOG,
     )
@@ -3,10 +3,11 @@ Office converter controller.
 """
 
 from fastapi import HTTPException, UploadFile, File, Form, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 import structlog
 
-from .service import office_converter_service
+from app.core.exceptions import ConversionError
+from .service import XLS_BATCH_FORMATS, office_converter_service
 from .types import OfficeConversionOptions
 
 logger = structlog.get_logger(__name__)
@@ -184,6 +185,58 @@ async def convert_xls_to_json(
             detail=f"Error converting file: {str(e)}"
         )
 
+async def convert_xls_to_all(
+    file: UploadFile = File(...),
+    targets: str = Form("csv,txt,json"),
+    encoding: str = Form("utf-8"),
+    sheet_name: str = Form(None)
+) -> Response:
+    """Convert XLS file to several formats at once, returned as a ZIP archive."""
+    try:
+        if not file.filename.lower().endswith('.xls'):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only .xls files are supported"
+            )
+
+        target_formats = {target.strip().lower() for target in targets.split(',') if target.strip()}
+        unsupported = target_formats - XLS_BATCH_FORMATS
+        if not target_formats or unsupported:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"targets must be a comma separated list of: {', '.join(sorted(XLS_BATCH_FORMATS))}"
+            )
+
+        file_content = await file.read()
+        options = OfficeConversionOptions(
+            encoding=encoding,
+            sheet_name=sheet_name
+        )
+
+        result = await office_converter_service.convert_xls_to_all(file_content, target_formats, options)
+
+        if result.status != 200:
+            raise HTTPException(
+                status_code=result.status,
+                detail=result.message
+            )
+
+        filename = file.filename.rsplit('.', 1)[0] + '.zip'
+        return Response(
+            content=result.data,
+            media_type="application/zip",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error in convert_xls_to_all controller", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error converting file: {str(e)}"
+        )
+
 # XLSX conversions
 async def convert_xlsx_to_xls(
     file: UploadFile = File(...),
@@ -271,6 +324,44 @@ async def convert_xlsx_to_csv(
             detail=f"Error converting file: {str(e)}"
         )
 
+async def convert_xlsx_to_csv_stream(
+    file: UploadFile = File(...),
+    encoding: str = Form("utf-8"),
+    sheet_name: str = Form(None)
+) -> StreamingResponse:
+    """Convert XLSX file to CSV, streaming rows to the client as they are converted."""
+    try:
+        if not file.filename.lower().endswith('.xlsx'):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only .xlsx files are supported"
+            )
+
+        file_content = await file.read()
+        options = OfficeConversionOptions(
+            encoding=encoding,
+            sheet_name=sheet_name
+        )
+
+        # Opens the workbook first, so bad input fails before the 200 status is sent
+        csv_chunks = await office_converter_service.convert_xlsx_to_csv_stream(file_content, options)
+
+        filename = file.filename.rsplit('.', 1)[0] + '.csv'
+        return StreamingResponse(
+            csv_chunks,
+            media_type="text/csv",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+
+    except (HTTPException, ConversionError):
+        raise
+    except Exception as e:
+        logger.error("Error in convert_xlsx_to_csv_stream controller", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error converting file: {str(e)}"
+        )
+
 async def convert_xlsx_to_txt(
     file: UploadFile = File(...),
     encoding: str = Form("utf-8"),
@@ -45,6 +45,15 @@ router.add_api_route(
     tags=["Office Conversion"]
 )
 
+router.add_api_route(
+    "/xls-to-all",
+    controller.convert_xls_to_all,
+    methods=["POST"],
+    summary="Convert XLS to CSV, TXT and JSON",
+    description="Upload an XLS file and get the requested formats (csv, txt, json) in one ZIP archive, parsing the workbook once",
+    tags=["Office Conversion"]
+)
+
 # XLSX conversions
 router.add_api_route(
     "/xlsx-to-xls",
@@ -64,6 +73,15 @@ router.add_api_route(
     tags=["Office Conversion"]
 )
 
+router.add_api_route(
+    "/xlsx-to-csv/stream",
+    controller.convert_xlsx_to_csv_stream,
+    methods=["POST"],
+    summary="Convert XLSX to CSV (streaming)",
+    description="Upload an XLSX file and stream the CSV output row by row",
+    tags=["Office Conversion"]
+)
+
 router.add_api_route(
     "/xlsx-to-txt",
     controller.convert_xlsx_to_txt,
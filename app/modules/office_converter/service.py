@@ -5,17 +5,58 @@ Handles XLS, XLSX, PPT, PPTX, ODT, ODS, ODP conversions.
 
 import io
 import csv
-from typing import Optional
+import json
+import asyncio
+import functools
+import zipfile
+from typing import Iterator, List, Optional, Set, Tuple
 import structlog
+import pandas as pd
 from openpyxl import Workbook, load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
 from pptx import Presentation
 import xlrd
 import xlwt
 
+from app.core.exceptions import ConversionError
 from .types import OfficeServiceResponse, OfficeConversionOptions
 
 logger = structlog.get_logger(__name__)
 
+# Bytes of CSV gathered before each streamed chunk is sent
+CSV_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Text formats one XLS parse can be converted to in a single request
+XLS_BATCH_FORMATS = frozenset({'csv', 'txt', 'json'})
+
+
+def office_op(name: str):
+    """Wrap a conversion method with shared logging and 500 error handling."""
+    completed_message = f"{name} conversion completed"
+    failed_message = f"{name} conversion failed"
+    error_message = f"Error converting {name}"
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> OfficeServiceResponse:
+            try:
+                response = await func(*args, **kwargs)
+                if response.status == 200:
+                    logger.info(completed_message)
+                return response
+
+            except Exception as e:
+                logger.error(failed_message, error=str(e))
+                return OfficeServiceResponse(
+                    status=500,
+                    message=error_message,
+                    error=str(e)
+                )
+
+        return wrapper
+
+    return decorator
+
 
 class OfficeConverterService:
     """Service for converting office formats."""
@@ -44,40 +85,20 @@ class OfficeConverterService:
         return self.supported_conversions.get(source_format, [])
 
     # XLS conversions
+    @office_op("XLS to XLSX")
     async def convert_xls_to_xlsx(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert XLS to XLSX."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
-
-            # Read XLS file
-            xls_workbook = xlrd.open_workbook(file_contents=file_buffer)
-            
-            # Create new XLSX workbook
-            xlsx_workbook = Workbook()
-            xlsx_workbook.remove(xlsx_workbook.active)  # Remove default sheet
-            
-            for sheet_name in xls_workbook.sheet_names():
-                xls_sheet = xls_workbook.sheet_by_name(sheet_name)
-                xlsx_sheet = xlsx_workbook.create_sheet(title=sheet_name)
-                
-                # Copy data
-                for row in range(xls_sheet.nrows):
-                    for col in range(xls_sheet.ncols):
-                        cell_value = xls_sheet.cell_value(row, col)
-                        xlsx_sheet.cell(row=row+1, column=col+1, value=cell_value)
-
-            # Save to bytes
-            xlsx_buffer = io.BytesIO()
-            xlsx_workbook.save(xlsx_buffer)
-            xlsx_content = xlsx_buffer.getvalue()
-            xlsx_buffer.close()
-
-            logger.info("XLS to XLSX conversion completed")
+        if options is None:
+            options = OfficeConversionOptions()
+
+        if not options.include_formatting:
+            # Plain value copy: let pandas do the columnar round trip
+            xlsx_content = self._convert_xls_to_xlsx_values(file_buffer)
+
             return OfficeServiceResponse(
                 status=200,
                 message="XLS converted to XLSX successfully",
@@ -85,464 +106,492 @@ class OfficeConverterService:
                 format="xlsx"
             )
 
-        except Exception as e:
-            logger.error("XLS to XLSX conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting XLS to XLSX",
-                error=str(e)
-            )
+        # Read XLS file
+        xls_workbook = xlrd.open_workbook(file_contents=file_buffer)
+
+        # Create new XLSX workbook (write-only: rows are flushed as they
+        # are appended instead of being kept as Cell objects until save)
+        xlsx_workbook = Workbook(write_only=True)
 
+        for sheet_name in xls_workbook.sheet_names():
+            xls_sheet = xls_workbook.sheet_by_name(sheet_name)
+            xlsx_sheet = xlsx_workbook.create_sheet(title=sheet_name)
+
+            # Copy data; XLS stores dates as serial numbers, so turn them back
+            # into datetimes the way the pandas value path does
+            for row in range(xls_sheet.nrows):
+                xlsx_sheet.append([
+                    xlrd.xldate_as_datetime(cell.value, xls_workbook.datemode)
+                    if cell.ctype == xlrd.XL_CELL_DATE else cell.value
+                    for cell in xls_sheet.row(row)
+                ])
+
+        # Save to bytes
+        xlsx_buffer = io.BytesIO()
+        xlsx_workbook.save(xlsx_buffer)
+        xlsx_content = xlsx_buffer.getvalue()
+        xlsx_buffer.close()
+
+        return OfficeServiceResponse(
+            status=200,
+            message="XLS converted to XLSX successfully",
+            data=xlsx_content,
+            format="xlsx"
+        )
+
+    def _convert_xls_to_xlsx_values(self, file_buffer: bytes) -> bytes:
+        """Copy every XLS sheet's values into a write-only XLSX workbook via pandas."""
+        sheets = pd.read_excel(io.BytesIO(file_buffer), sheet_name=None, header=None, engine='xlrd')
+
+        xlsx_workbook = Workbook(write_only=True)
+        for sheet_name, data_frame in sheets.items():
+            xlsx_sheet = xlsx_workbook.create_sheet(title=sheet_name)
+            # Empty cells come back as NaN/NaT; write them as blanks
+            values = data_frame.astype(object).where(data_frame.notna(), None)
+            for row in values.itertuples(index=False, name=None):
+                xlsx_sheet.append(row)
+
+        xlsx_buffer = io.BytesIO()
+        xlsx_workbook.save(xlsx_buffer)
+        xlsx_content = xlsx_buffer.getvalue()
+        xlsx_buffer.close()
+        return xlsx_content
+
+    def _read_xls_rows(self, file_buffer: bytes, sheet_name: Optional[str] = None) -> Tuple[str, List[list]]:
+        """Parse an XLS sheet once and return its name with the row values."""
+        xls_workbook = xlrd.open_workbook(file_contents=file_buffer)
+        xls_sheet = xls_workbook.sheet_by_name(sheet_name or xls_workbook.sheet_names()[0])
+        return xls_sheet.name, [xls_sheet.row_values(row) for row in range(xls_sheet.nrows)]
+
+    def _rows_to_csv(self, rows: List[list]) -> str:
+        """Format parsed rows as CSV."""
+        csv_buffer = io.StringIO()
+        writer = csv.writer(csv_buffer)
+
+        # csv.writer stringifies cell values itself
+        writer.writerows(rows)
+
+        csv_content = csv_buffer.getvalue()
+        csv_buffer.close()
+        return csv_content
+
+    def _rows_to_txt(self, rows: List[list]) -> str:
+        """Format parsed rows as tab separated text."""
+        return "\n".join("\t".join(map(str, row)) for row in rows)
+
+    def _rows_to_json(self, sheet_name: str, rows: List[list]) -> str:
+        """Format parsed rows as JSON."""
+        json_data = {
+            "sheet_name": sheet_name,
+            "data": [
+                {f"col_{col}": cell_value for col, cell_value in enumerate(row)}
+                for row in rows
+            ]
+        }
+        return json.dumps(json_data, indent=2)
+
+    @office_op("XLS to CSV")
     async def convert_xls_to_csv(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert XLS to CSV."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
+        if options is None:
+            options = OfficeConversionOptions()
 
-            # Read XLS file
-            xls_workbook = xlrd.open_workbook(file_contents=file_buffer)
-            sheet_name = options.sheet_name or xls_workbook.sheet_names()[0]
-            xls_sheet = xls_workbook.sheet_by_name(sheet_name)
-            
-            # Convert to CSV
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer)
-            
-            for row in range(xls_sheet.nrows):
-                row_data = []
-                for col in range(xls_sheet.ncols):
-                    cell_value = xls_sheet.cell_value(row, col)
-                    row_data.append(str(cell_value))
-                writer.writerow(row_data)
-            
-            csv_content = csv_buffer.getvalue()
-            csv_buffer.close()
-
-            logger.info("XLS to CSV conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="XLS converted to CSV successfully",
-                data=csv_content.encode(options.encoding),
-                format="csv"
-            )
+        _, rows = self._read_xls_rows(file_buffer, options.sheet_name)
+        csv_content = self._rows_to_csv(rows)
 
-        except Exception as e:
-            logger.error("XLS to CSV conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting XLS to CSV",
-                error=str(e)
-            )
+        return OfficeServiceResponse(
+            status=200,
+            message="XLS converted to CSV successfully",
+            data=csv_content.encode(options.encoding),
+            format="csv"
+        )
 
+    @office_op("XLS to TXT")
     async def convert_xls_to_txt(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert XLS to TXT."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
+        if options is None:
+            options = OfficeConversionOptions()
 
-            # Read XLS file
-            xls_workbook = xlrd.open_workbook(file_contents=file_buffer)
-            sheet_name = options.sheet_name or xls_workbook.sheet_names()[0]
-            xls_sheet = xls_workbook.sheet_by_name(sheet_name)
-            
-            # Convert to text
-            text_lines = []
-            for row in range(xls_sheet.nrows):
-                row_data = []
-                for col in range(xls_sheet.ncols):
-                    cell_value = xls_sheet.cell_value(row, col)
-                    row_data.append(str(cell_value))
-                text_lines.append("\t".join(row_data))
-            
-            text_content = "\n".join(text_lines)
-
-            logger.info("XLS to TXT conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="XLS converted to TXT successfully",
-                data=text_content.encode(options.encoding),
-                format="txt"
-            )
+        _, rows = self._read_xls_rows(file_buffer, options.sheet_name)
+        text_content = self._rows_to_txt(rows)
 
-        except Exception as e:
-            logger.error("XLS to TXT conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting XLS to TXT",
-                error=str(e)
-            )
+        return OfficeServiceResponse(
+            status=200,
+            message="XLS converted to TXT successfully",
+            data=text_content.encode(options.encoding),
+            format="txt"
+        )
 
+    @office_op("XLS to JSON")
     async def convert_xls_to_json(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert XLS to JSON."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
+        if options is None:
+            options = OfficeConversionOptions()
 
-            # Read XLS file
-            xls_workbook = xlrd.open_workbook(file_contents=file_buffer)
-            sheet_name = options.sheet_name or xls_workbook.sheet_names()[0]
-            xls_sheet = xls_workbook.sheet_by_name(sheet_name)
-            
-            # Convert to JSON
-            json_data = {
-                "sheet_name": sheet_name,
-                "data": []
-            }
-            
-            for row in range(xls_sheet.nrows):
-                row_data = {}
-                for col in range(xls_sheet.ncols):
-                    cell_value = xls_sheet.cell_value(row, col)
-                    row_data[f"col_{col}"] = cell_value
-                json_data["data"].append(row_data)
-            
-            import json
-            json_str = json.dumps(json_data, indent=2)
-
-            logger.info("XLS to JSON conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="XLS converted to JSON successfully",
-                data=json_str.encode(options.encoding),
-                format="json"
-            )
+        sheet_name, rows = self._read_xls_rows(file_buffer, options.sheet_name)
+        json_str = self._rows_to_json(sheet_name, rows)
 
-        except Exception as e:
-            logger.error("XLS to JSON conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting XLS to JSON",
-                error=str(e)
-            )
+        return OfficeServiceResponse(
+            status=200,
+            message="XLS converted to JSON successfully",
+            data=json_str.encode(options.encoding),
+            format="json"
+        )
+
+    @office_op("XLS to multiple formats")
+    async def convert_xls_to_all(
+        self,
+        file_buffer: bytes,
+        targets: Set[str],
+        options: Optional[OfficeConversionOptions] = None
+    ) -> OfficeServiceResponse:
+        """Convert XLS to several of XLS_BATCH_FORMATS from a single parse, bundled as a ZIP archive."""
+        if options is None:
+            options = OfficeConversionOptions()
+
+        sheet_name, rows = self._read_xls_rows(file_buffer, options.sheet_name)
+
+        archive_buffer = io.BytesIO()
+        with zipfile.ZipFile(archive_buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for target in sorted(targets):
+                if target == 'csv':
+                    content = self._rows_to_csv(rows)
+                elif target == 'txt':
+                    content = self._rows_to_txt(rows)
+                else:
+                    content = self._rows_to_json(sheet_name, rows)
+                archive.writestr(f"{sheet_name}.{target}", content.encode(options.encoding))
+
+        archive_content = archive_buffer.getvalue()
+        archive_buffer.close()
+
+        return OfficeServiceResponse(
+            status=200,
+            message="XLS converted to multiple formats successfully",
+            data=archive_content,
+            format="zip"
+        )
 
     # XLSX conversions
+    @office_op("XLSX to XLS")
     async def convert_xlsx_to_xls(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert XLSX to XLS."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
-
-            # Read XLSX file
-            xlsx_workbook = load_workbook(io.BytesIO(file_buffer))
-            
-            # Create new XLS workbook
-            xls_workbook = xlwt.Workbook()
-            
-            for sheet_name in xlsx_workbook.sheetnames:
-                xlsx_sheet = xlsx_workbook[sheet_name]
-                xls_sheet = xls_workbook.add_sheet(sheet_name)
-                
-                # Copy data
-                for row in xlsx_sheet.iter_rows():
-                    for cell in row:
-                        if cell.value is not None:
-                            xls_sheet.write(cell.row-1, cell.column-1, cell.value)
-
-            # Save to bytes
-            xls_buffer = io.BytesIO()
-            xls_workbook.save(xls_buffer)
-            xls_content = xls_buffer.getvalue()
-            xls_buffer.close()
-
-            logger.info("XLSX to XLS conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="XLSX converted to XLS successfully",
-                data=xls_content,
-                format="xls"
-            )
+        if options is None:
+            options = OfficeConversionOptions()
 
-        except Exception as e:
-            logger.error("XLSX to XLS conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting XLSX to XLS",
-                error=str(e)
-            )
+        # Read XLSX file
+        xlsx_workbook = load_workbook(io.BytesIO(file_buffer))
+
+        # Create new XLS workbook
+        xls_workbook = xlwt.Workbook()
 
+        for sheet_name in xlsx_workbook.sheetnames:
+            xlsx_sheet = xlsx_workbook[sheet_name]
+            xls_sheet = xls_workbook.add_sheet(sheet_name)
+
+            # Copy data
+            for row in xlsx_sheet.iter_rows():
+                for cell in row:
+                    if cell.value is not None:
+                        xls_sheet.write(cell.row-1, cell.column-1, cell.value)
+
+        # Save to bytes
+        xls_buffer = io.BytesIO()
+        xls_workbook.save(xls_buffer)
+        xls_content = xls_buffer.getvalue()
+        xls_buffer.close()
+
+        return OfficeServiceResponse(
+            status=200,
+            message="XLSX converted to XLS successfully",
+            data=xls_content,
+            format="xls"
+        )
+
+    @office_op("XLSX to CSV")
     async def convert_xlsx_to_csv(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert XLSX to CSV."""
+        if options is None:
+            options = OfficeConversionOptions()
+
+        # Read XLSX file
+        xlsx_workbook = load_workbook(io.BytesIO(file_buffer))
+        sheet_name = options.sheet_name or xlsx_workbook.sheetnames[0]
+        xlsx_sheet = xlsx_workbook[sheet_name]
+
+        # Convert to CSV
+        csv_buffer = io.StringIO()
+        writer = csv.writer(csv_buffer)
+
+        for row in xlsx_sheet.iter_rows(values_only=True):
+            writer.writerow(row)
+
+        csv_content = csv_buffer.getvalue()
+        csv_buffer.close()
+
+        return OfficeServiceResponse(
+            status=200,
+            message="XLSX converted to CSV successfully",
+            data=csv_content.encode(options.encoding),
+            format="csv"
+        )
+
+    def _open_xlsx_sheet(self, file_buffer: bytes, options: OfficeConversionOptions):
+        """Open an XLSX workbook read-only and look up the requested sheet.
+
+        Raises ConversionError(400) for unreadable files and unknown sheets.
+        """
         try:
-            if options is None:
-                options = OfficeConversionOptions()
+            xlsx_workbook = load_workbook(io.BytesIO(file_buffer), read_only=True)
+        except (InvalidFileException, zipfile.BadZipFile) as e:
+            raise ConversionError(400, f"Invalid XLSX file: {e}")
+
+        sheet_name = options.sheet_name or xlsx_workbook.sheetnames[0]
+        if sheet_name not in xlsx_workbook.sheetnames:
+            xlsx_workbook.close()
+            raise ConversionError(400, f"Sheet '{sheet_name}' not found")
+
+        return xlsx_workbook, xlsx_workbook[sheet_name]
+
+    def _xlsx_csv_chunks(self, xlsx_workbook, xlsx_sheet, options: OfficeConversionOptions) -> Iterator[bytes]:
+        """Write a sheet as CSV, yielding the encoded output in CSV_STREAM_CHUNK_SIZE pieces."""
+        try:
+            csv_buffer = io.BytesIO()
+            text_buffer = io.TextIOWrapper(csv_buffer, encoding=options.encoding, newline='')
+            writer = csv.writer(text_buffer)
 
-            # Read XLSX file
-            xlsx_workbook = load_workbook(io.BytesIO(file_buffer))
-            sheet_name = options.sheet_name or xlsx_workbook.sheetnames[0]
-            xlsx_sheet = xlsx_workbook[sheet_name]
-            
-            # Convert to CSV
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer)
-            
             for row in xlsx_sheet.iter_rows(values_only=True):
                 writer.writerow(row)
-            
-            csv_content = csv_buffer.getvalue()
-            csv_buffer.close()
+                text_buffer.flush()
+                if csv_buffer.tell() >= CSV_STREAM_CHUNK_SIZE:
+                    yield csv_buffer.getvalue()
+                    csv_buffer.seek(0)
+                    csv_buffer.truncate(0)
 
-            logger.info("XLSX to CSV conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="XLSX converted to CSV successfully",
-                data=csv_content.encode(options.encoding),
-                format="csv"
-            )
+            text_buffer.flush()
+            if csv_buffer.tell():
+                yield csv_buffer.getvalue()
+
+            logger.info("XLSX to CSV streaming conversion completed")
 
         except Exception as e:
-            logger.error("XLSX to CSV conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting XLSX to CSV",
-                error=str(e)
-            )
+            logger.error("XLSX to CSV streaming conversion failed", error=str(e))
+            raise
+
+        finally:
+            xlsx_workbook.close()
+
+    async def convert_xlsx_to_csv_stream(
+        self,
+        file_buffer: bytes,
+        options: Optional[OfficeConversionOptions] = None
+    ) -> Iterator[bytes]:
+        """Convert XLSX to CSV, returning an iterator of encoded CSV chunks.
+
+        The workbook is opened and the sheet checked before this returns, so
+        bad input raises ConversionError while an error status can still be
+        sent. The iterator is synchronous; StreamingResponse runs it in the
+        threadpool so openpyxl's parsing stays off the event loop.
+        """
+        if options is None:
+            options = OfficeConversionOptions()
 
+        xlsx_workbook, xlsx_sheet = await asyncio.to_thread(self._open_xlsx_sheet, file_buffer, options)
+        return self._xlsx_csv_chunks(xlsx_workbook, xlsx_sheet, options)
+
+    @office_op("XLSX to TXT")
     async def convert_xlsx_to_txt(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert XLSX to TXT."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
+        if options is None:
+            options = OfficeConversionOptions()
 
-            # Read XLSX file
-            xlsx_workbook = load_workbook(io.BytesIO(file_buffer))
-            sheet_name = options.sheet_name or xlsx_workbook.sheetnames[0]
-            xlsx_sheet = xlsx_workbook[sheet_name]
-            
-            # Convert to text
-            text_lines = []
-            for row in xlsx_sheet.iter_rows(values_only=True):
-                text_lines.append("\t".join(str(cell) if cell is not None else "" for cell in row))
-            
-            text_content = "\n".join(text_lines)
+        # Read XLSX file
+        xlsx_workbook = load_workbook(io.BytesIO(file_buffer))
+        sheet_name = options.sheet_name or xlsx_workbook.sheetnames[0]
+        xlsx_sheet = xlsx_workbook[sheet_name]
 
-            logger.info("XLSX to TXT conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="XLSX converted to TXT successfully",
-                data=text_content.encode(options.encoding),
-                format="txt"
-            )
+        # Convert to text
+        text_lines = []
+        for row in xlsx_sheet.iter_rows(values_only=True):
+            text_lines.append("\t".join(str(cell) if cell is not None else "" for cell in row))
 
-        except Exception as e:
-            logger.error("XLSX to TXT conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting XLSX to TXT",
-                error=str(e)
-            )
+        text_content = "\n".join(text_lines)
+
+        return OfficeServiceResponse(
+            status=200,
+            message="XLSX converted to TXT successfully",
+            data=text_content.encode(options.encoding),
+            format="txt"
+        )
 
+    @office_op("XLSX to JSON")
     async def convert_xlsx_to_json(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert XLSX to JSON."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
+        if options is None:
+            options = OfficeConversionOptions()
+
+        # Read XLSX file
+        xlsx_workbook = load_workbook(io.BytesIO(file_buffer))
+        sheet_name = options.sheet_name or xlsx_workbook.sheetnames[0]
+        xlsx_sheet = xlsx_workbook[sheet_name]
+
+        # Convert to JSON
+        json_data = {
+            "sheet_name": sheet_name,
+            "data": []
+        }
 
-            # Read XLSX file
-            xlsx_workbook = load_workbook(io.BytesIO(file_buffer))
-            sheet_name = options.sheet_name or xlsx_workbook.sheetnames[0]
-            xlsx_sheet = xlsx_workbook[sheet_name]
-            
-            # Convert to JSON
-            json_data = {
-                "sheet_name": sheet_name,
-                "data": []
-            }
-            
-            for row in xlsx_sheet.iter_rows(values_only=True):
-                row_data = {}
-                for i, cell in enumerate(row):
-                    row_data[f"col_{i}"] = cell
-                json_data["data"].append(row_data)
-            
-            import json
-            json_str = json.dumps(json_data, indent=2)
-
-            logger.info("XLSX to JSON conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="XLSX converted to JSON successfully",
-                data=json_str.encode(options.encoding),
-                format="json"
-            )
+        for row in xlsx_sheet.iter_rows(values_only=True):
+            row_data = {}
+            for i, cell in enumerate(row):
+                row_data[f"col_{i}"] = cell
+            json_data["data"].append(row_data)
 
-        except Exception as e:
-            logger.error("XLSX to JSON conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting XLSX to JSON",
-                error=str(e)
-            )
+        json_str = json.dumps(json_data, indent=2)
+
+        return OfficeServiceResponse(
+            status=200,
+            message="XLSX converted to JSON successfully",
+            data=json_str.encode(options.encoding),
+            format="json"
+        )
 
     # PPT conversions
+    @office_op("PPT to PPTX")
     async def convert_ppt_to_pptx(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert PPT to PPTX."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
-
-            # For now, return a placeholder response
-            # PPT to PPTX conversion requires more complex handling
-            logger.warning("PPT to PPTX conversion not fully implemented")
-            return OfficeServiceResponse(
-                status=501,
-                message="PPT to PPTX conversion requires additional libraries",
-                error="PPT to PPTX conversion not implemented"
-            )
-
-        except Exception as e:
-            logger.error("PPT to PPTX conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting PPT to PPTX",
-                error=str(e)
-            )
-
+        if options is None:
+            options = OfficeConversionOptions()
+
+        # For now, return a placeholder response
+        # PPT to PPTX conversion requires more complex handling
+        logger.warning("PPT to PPTX conversion not fully implemented")
+        return OfficeServiceResponse(
+            status=501,
+            message="PPT to PPTX conversion requires additional libraries",
+            error="PPT to PPTX conversion not implemented"
+        )
+
+    @office_op("PPT to TXT")
     async def convert_ppt_to_txt(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert PPT to TXT."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
-
-            # For now, return a placeholder response
-            logger.warning("PPT to TXT conversion not fully implemented")
-            return OfficeServiceResponse(
-                status=501,
-                message="PPT to TXT conversion requires additional libraries",
-                error="PPT to TXT conversion not implemented"
-            )
+        if options is None:
+            options = OfficeConversionOptions()
 
-        except Exception as e:
-            logger.error("PPT to TXT conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting PPT to TXT",
-                error=str(e)
-            )
+        # For now, return a placeholder response
+        logger.warning("PPT to TXT conversion not fully implemented")
+        return OfficeServiceResponse(
+            status=501,
+            message="PPT to TXT conversion requires additional libraries",
+            error="PPT to TXT conversion not implemented"
+        )
 
     # PPTX conversions
+    @office_op("PPTX to TXT")
     async def convert_pptx_to_txt(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert PPTX to TXT."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
-
-            # Read PPTX file
-            presentation = Presentation(io.BytesIO(file_buffer))
-            
-            # Extract text from slides
-            text_content = []
-            for i, slide in enumerate(presentation.slides):
-                if options.slide_number is None or i == options.slide_number - 1:
-                    slide_text = []
-                    for shape in slide.shapes:
-                        if hasattr(shape, "text"):
-                            slide_text.append(shape.text)
-                    if slide_text:
-                        text_content.append(f"Slide {i+1}:")
-                        text_content.append("\n".join(slide_text))
-                        text_content.append("")
-
-            result_text = "\n".join(text_content)
-
-            logger.info("PPTX to TXT conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="PPTX converted to TXT successfully",
-                data=result_text.encode(options.encoding),
-                format="txt"
-            )
-
-        except Exception as e:
-            logger.error("PPTX to TXT conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting PPTX to TXT",
-                error=str(e)
-            )
-
+        if options is None:
+            options = OfficeConversionOptions()
+
+        # Read PPTX file
+        presentation = Presentation(io.BytesIO(file_buffer))
+
+        # Extract text from slides
+        text_content = []
+        for i, slide in enumerate(presentation.slides):
+            if options.slide_number is None or i == options.slide_number - 1:
+                slide_text = []
+                for shape in slide.shapes:
+                    if hasattr(shape, "text"):
+                        slide_text.append(shape.text)
+                if slide_text:
+                    text_content.append(f"Slide {i+1}:")
+                    text_content.append("\n".join(slide_text))
+                    text_content.append("")
+
+        result_text = "\n".join(text_content)
+
+        return OfficeServiceResponse(
+            status=200,
+            message="PPTX converted to TXT successfully",
+            data=result_text.encode(options.encoding),
+            format="txt"
+        )
+
+    @office_op("PPTX to HTML")
     async def convert_pptx_to_html(
         self,
         file_buffer: bytes,
         options: Optional[OfficeConversionOptions] = None
     ) -> OfficeServiceResponse:
         """Convert PPTX to HTML."""
-        try:
-            if options is None:
-                options = OfficeConversionOptions()
-
-            # Read PPTX file
-            presentation = Presentation(io.BytesIO(file_buffer))
-            
-            # Convert to HTML
-            html_content = f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="{options.encoding}">\n<title>Presentation</title>\n</head>\n<body>\n'
-            
-            for i, slide in enumerate(presentation.slides):
-                if options.slide_number is None or i == options.slide_number - 1:
-                    html_content += f'<div class="slide">\n<h2>Slide {i+1}</h2>\n'
-                    
-                    for shape in slide.shapes:
-                        if hasattr(shape, "text"):
-                            html_content += f'<p>{shape.text}</p>\n'
-                    
-                    html_content += '</div>\n'
-            
-            html_content += '</body>\n</html>'
-
-            logger.info("PPTX to HTML conversion completed")
-            return OfficeServiceResponse(
-                status=200,
-                message="PPTX converted to HTML successfully",
-                data=html_content.encode(options.encoding),
-                format="html"
-            )
+        if options is None:
+            options = OfficeConversionOptions()
 
-        except Exception as e:
-            logger.error("PPTX to HTML conversion failed", error=str(e))
-            return OfficeServiceResponse(
-                status=500,
-                message="Error converting PPTX to HTML",
-                error=str(e)
-            )
+        # Read PPTX file
+        presentation = Presentation(io.BytesIO(file_buffer))
+
+        # Convert to HTML
+        html_content = f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="{options.encoding}">\n<title>Presentation</title>\n</head>\n<body>\n'
+
+        for i, slide in enumerate(presentation.slides):
+            if options.slide_number is None or i == options.slide_number - 1:
+                html_content += f'<div class="slide">\n<h2>Slide {i+1}</h2>\n'
+
+                for shape in slide.shapes:
+                    if hasattr(shape, "text"):
+                        html_content += f'<p>{shape.text}</p>\n'
+
+                html_content += '</div>\n'
+
+        html_content += '</body>\n</html>'
+
+        return OfficeServiceResponse(
+            status=200,
+            message="PPTX converted to HTML successfully",
+            data=html_content.encode(options.encoding),
+            format="html"
+        )
 
     async def get_supported_conversions(self):
         """Get list of supported office conversions."""
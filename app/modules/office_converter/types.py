@@ -2,12 +2,14 @@
 Office converter types.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, SkipValidation
 from typing import Optional
 
 
 class OfficeConversionOptions(BaseModel):
     """Options for office format conversions."""
+
+    model_config = ConfigDict(frozen=True)
     
     encoding: str = "utf-8"
     include_formatting: bool = True
@@ -22,6 +24,6 @@ class OfficeServiceResponse(BaseModel):
     
     status: int
     message: str
-    data: Optional[bytes] = None
+    data: SkipValidation[Optional[bytes]] = None  # converted payload, passed through as-is
     format: Optional[str] = None
     error: Optional[str] = None
@@ -0,0 +1,115 @@
+"""
+Video conversion result cache.
+Keeps converted files on disk keyed by the uploaded content and conversion options.
+"""
+
+import asyncio
+import hashlib
+import os
+import shutil
+import uuid
+from typing import Optional
+
+import structlog
+
+from .types import VideoConversionOptions
+
+logger = structlog.get_logger(__name__)
+
+
+class ConversionCache:
+    """Size-bounded on-disk cache of converted videos, evicting least recently used entries."""
+
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+        # Links handed to responses live beside the entries but outside the size accounting
+        self.served_directory = os.path.join(directory, 'served')
+        if self.enabled:
+            os.makedirs(self.served_directory, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is turned on."""
+        return self.max_size > 0
+
+    def make_key(self, content_digest: str, target_format: str, options: VideoConversionOptions) -> str:
+        """Build the cache key for an upload digest, target format and options."""
+        fingerprint = f"{content_digest}|{target_format}|{options.model_dump_json()}"
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a private hard link to the cached file for a key, marking it as recently used.
+
+        The caller owns the returned path and removes it once the file is sent, so
+        evicting the entry in the meantime can't pull the file out from under it.
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        served_path = os.path.join(self.served_directory, f"{key}.{uuid.uuid4().hex}")
+        try:
+            os.link(path, served_path)
+        except FileNotFoundError:
+            return None
+
+        # Same inode, so this refreshes the entry's LRU position even if it was just evicted
+        os.utime(served_path)
+        return served_path
+
+    async def put(self, key: str, source_path: str) -> None:
+        """Store a converted file under a key, then trim the cache to its size limit.
+
+        Runs in a worker thread, since the copy fallback and the directory scan block.
+        """
+        if not self.enabled:
+            return
+
+        await asyncio.to_thread(self._store, key, source_path)
+
+    def _store(self, key: str, source_path: str) -> None:
+        """Link or copy a converted file into the cache and evict; blocking."""
+        path = self._path(key)
+        try:
+            try:
+                os.link(source_path, path)
+            except FileExistsError:
+                return
+            except OSError:
+                # Different filesystem: copy aside first so get() never links a partial file
+                staging_path = os.path.join(self.served_directory, f"{key}.{uuid.uuid4().hex}")
+                try:
+                    shutil.copyfile(source_path, staging_path)
+                    os.link(staging_path, path)
+                except FileExistsError:
+                    return
+                finally:
+                    os.unlink(staging_path)
+
+            self._evict()
+        except OSError as e:
+            logger.warning("Failed to cache converted video", error=str(e))
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size limit."""
+        entries = []
+        total_size = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+                total_size -= size
+            except FileNotFoundError:
+                pass
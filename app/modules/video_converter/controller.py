@@ -3,991 +3,409 @@ Video converter controller.
 Handles API request parsing and calls to the video conversion service.
 """
 
-from fastapi import HTTPException, status, UploadFile, File, Form
-from fastapi.responses import Response
-from typing import Optional
+import asyncio
+import hashlib
+import os
+import tempfile
+import zipfile
+from fastapi import Depends, HTTPException, status, UploadFile, File, Form
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, get_args
+from urllib.parse import quote
+import aiofiles
+import orjson
 import structlog
 
-from .service import video_converter_service
-from .types import VideoConversionOptions
+from app.core.config import settings
+from app.core.exceptions import ConversionError
+from .cache import ConversionCache
+from .service import MAX_CONCURRENT_CONVERSIONS, STREAMING_MUXER_ARGS, video_converter_service
+from .types import (
+    VideoCodec,
+    VideoConversionOptions,
+    VideoHwAccel,
+    VideoPreset,
+    VideoResolution,
+    VideoServiceResponse,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Uploads are copied to disk in 1 MiB chunks instead of being read into memory at once
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# RAM-backed spool directory for small uploads, if one is mounted
+SPOOL_DIR = settings.VIDEO_SPOOL_DIR if os.path.isdir(settings.VIDEO_SPOOL_DIR) else None
+
+# Lets ffmpeg open an already-spilled multipart upload through its descriptor
+PROC_FD_AVAILABLE = os.path.isdir('/proc/self/fd')
+
+# Bounds how many ffmpeg conversions run at once in this worker
+CONVERSION_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_CONVERSIONS)
+
+# Bitrate (kbps) and frame rate used when the request doesn't set them
+DEFAULT_BITRATE = 2000
+DEFAULT_FPS = 30
+
+# Requested bitrates are snapped to this step (kbps) so near-identical requests share cached results
+BITRATE_STEP = 100
+
+# Rungs encoded when a ladder request doesn't name its resolutions
+DEFAULT_LADDER = "1920x1080,1280x720,854x480"
+
+# Response media type for each target container
+VIDEO_MEDIA_TYPES = {
+    'mp4': "video/mp4",
+    'avi': "video/x-msvideo",
+    'mov': "video/quicktime",
+    'mkv': "video/x-matroska",
+    'webm': "video/webm",
+}
+
+# Video payloads are already entropy-coded, so ask proxies not to recompress them
+VIDEO_RESPONSE_HEADERS = {"Cache-Control": "private, no-transform"}
+
+# Accepted upload suffixes for each source container
+VIDEO_SUFFIXES = {
+    video_format: frozenset({f'.{video_format}'})
+    for video_format in VIDEO_MEDIA_TYPES
+}
+
+# (source, target) pairs exposed as endpoints
+VIDEO_CONVERSIONS = [
+    (source_format, target_format)
+    for source_format in VIDEO_MEDIA_TYPES
+    for target_format in VIDEO_MEDIA_TYPES
+    if source_format != target_format
+]
+
+
+def _content_disposition(filename: str) -> str:
+    """Attachment header for a download name, RFC 5987-encoded when it is not plain ASCII."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+
+    return f'attachment; filename="{filename}"'
+
+
+def _parse_ladder(resolutions: str) -> List[str]:
+    """Split a comma separated list of ladder resolutions, rejecting unknown sizes."""
+    ladder = list(dict.fromkeys(size.strip() for size in resolutions.split(',') if size.strip()))
+    allowed = get_args(VideoResolution)
+    if not ladder or any(size not in allowed for size in ladder):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"resolutions must be a comma separated list of: {', '.join(allowed)}"
+        )
+
+    return ladder
+
+
+def _zip_rungs(output_paths: Dict[str, str], stem: str, target_format: str) -> str:
+    """Bundle ladder outputs into one archive file and return its path."""
+    fd, archive_path = tempfile.mkstemp(suffix='.zip')
+    os.close(fd)
+    try:
+        # The videos are already compressed, so store them as they are
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_STORED) as archive:
+            for resolution, output_path in output_paths.items():
+                archive.write(output_path, f"{stem}_{resolution}.{target_format}")
+    except BaseException:
+        os.unlink(archive_path)
+        raise
+
+    return archive_path
+
+
+def video_conversion_options(
+    resolution: Optional[VideoResolution] = Form(None),
+    bitrate: Optional[int] = Form(None, ge=100, le=100000),
+    fps: Optional[int] = Form(None, ge=1, le=240),
+    codec: Optional[VideoCodec] = Form(None),
+    hw_accel: VideoHwAccel = Form("auto"),
+    preset: Optional[VideoPreset] = Form(None)
+) -> VideoConversionOptions:
+    """Build conversion options from the request's form fields.
+
+    The fields are already validated by their Form declarations, so the model
+    is constructed without running pydantic validation again.
+    """
+    # Without explicit encoding settings a plain container change is enough; decided
+    # before the defaults are filled in and the bitrate is snapped
+    allow_remux = resolution is None and bitrate is None and fps is None and codec is None
+
+    if bitrate is None:
+        bitrate = DEFAULT_BITRATE
+    bitrate = max(BITRATE_STEP, round(bitrate / BITRATE_STEP) * BITRATE_STEP)
+
+    return VideoConversionOptions.model_construct(
+        resolution=resolution,
+        bitrate=f"{bitrate}k",
+        fps=DEFAULT_FPS if fps is None else fps,
+        codec=codec,
+        hw_accel=hw_accel,
+        preset=preset,
+        allow_remux=allow_remux
+    )
+
 
 class VideoConverterController:
     """Controller for video conversion endpoints."""
 
     def __init__(self):
         self.service = video_converter_service
+        self.cache = ConversionCache(settings.VIDEO_CACHE_DIR, settings.VIDEO_CACHE_MAX_SIZE)
+        self._supported_conversions: Optional[bytes] = None
 
-    # MP4 conversions
-    async def convert_mp4_to_avi(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert MP4 to AVI."""
-        try:
-            if not file.filename.lower().endswith('.mp4'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mp4 files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mp4_to_avi(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
+    async def _spool_upload(self, file: UploadFile, source_format: str) -> Tuple[str, str]:
+        """Write the upload to a temporary file chunk by chunk.
 
-            filename = file.filename.rsplit('.', 1)[0] + '.avi'
-            return Response(
-                content=result.data,
-                media_type="video/x-msvideo",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
+        Returns the spool path and the SHA-256 digest of the content.
+        """
+        spool_dir = None
+        if SPOOL_DIR and file.size is not None and file.size <= settings.VIDEO_SPOOL_DIR_MAX_SIZE:
+            spool_dir = SPOOL_DIR
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mp4_to_avi controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_mp4_to_mov(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert MP4 to MOV."""
+        fd, spool_path = tempfile.mkstemp(suffix=f'.{source_format}', dir=spool_dir)
+        os.close(fd)
+        digest = hashlib.sha256()
         try:
-            if not file.filename.lower().endswith('.mp4'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mp4 files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mp4_to_mov(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mov'
-            return Response(
-                content=result.data,
-                media_type="video/quicktime",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
+            async with aiofiles.open(spool_path, 'wb') as spool:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    await spool.write(chunk)
+        except Exception:
+            os.unlink(spool_path)
             raise
-        except Exception as e:
-            logger.error("Error in convert_mp4_to_mov controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_mp4_to_mkv(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert MP4 to MKV."""
-        try:
-            if not file.filename.lower().endswith('.mp4'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mp4 files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mp4_to_mkv(file_content, options)
+        finally:
+            # Free the multipart spool now rather than holding it for the whole encode
+            await file.close()
 
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mkv'
-            return Response(
-                content=result.data,
-                media_type="video/x-matroska",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
+        return spool_path, digest.hexdigest()
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mp4_to_mkv controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_mp4_to_webm(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("vp9")
-    ) -> Response:
-        """Convert MP4 to WEBM."""
-        try:
-            if not file.filename.lower().endswith('.mp4'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mp4 files are supported"
-                )
+    def _can_read_in_place(self, file: UploadFile) -> bool:
+        """Whether ffmpeg can read Starlette's own on-disk spool of the upload."""
+        if not PROC_FD_AVAILABLE or not getattr(file.file, '_rolled', False):
+            return False
 
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
+        # Small uploads are still better off copied to the RAM-backed spool
+        return not (SPOOL_DIR and file.size is not None and file.size <= settings.VIDEO_SPOOL_DIR_MAX_SIZE)
 
-            result = await self.service.convert_mp4_to_webm(file_content, options)
+    async def _stage_upload(self, file: UploadFile, source_format: str) -> Tuple[str, str, bool]:
+        """Make the upload available to ffmpeg as a file path.
 
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
+        Returns the path, the SHA-256 digest of the content and whether the
+        path is a spool copy the caller has to remove.
+        """
+        if not self._can_read_in_place(file):
+            spool_path, content_digest = await self._spool_upload(file, source_format)
+            return spool_path, content_digest, True
 
-            filename = file.filename.rsplit('.', 1)[0] + '.webm'
-            return Response(
-                content=result.data,
-                media_type="video/webm",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
+        # The upload already spilled to disk: hash it and hand ffmpeg its descriptor
+        # instead of copying it a second time
+        digest = hashlib.sha256()
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mp4_to_webm controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
+        return f'/proc/{os.getpid()}/fd/{file.file.fileno()}', digest.hexdigest(), False
 
-    # AVI conversions
-    async def convert_avi_to_mp4(
+    async def _handle_conversion(
         self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
+        file: UploadFile,
+        source_format: str,
+        target_format: str,
+        media_type: str,
+        options: VideoConversionOptions,
+        service_fn: Callable[[str, VideoConversionOptions], Awaitable[VideoServiceResponse]],
+        stream: bool = False
     ) -> Response:
-        """Convert AVI to MP4."""
-        try:
-            if not file.filename.lower().endswith('.avi'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .avi files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_avi_to_mp4(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mp4'
-            return Response(
-                content=result.data,
-                media_type="video/mp4",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_avi_to_mp4 controller", error=str(e))
+        """Validate, spool and convert an uploaded video, then build the response."""
+        stem, extension = os.path.splitext(file.filename or "")
+        if extension.lower() not in VIDEO_SUFFIXES[source_format]:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_avi_to_mov(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert AVI to MOV."""
-        try:
-            if not file.filename.lower().endswith('.avi'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .avi files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_avi_to_mov(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mov'
-            return Response(
-                content=result.data,
-                media_type="video/quicktime",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Only .{source_format} files are supported"
             )
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_avi_to_mov controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
+        filename = f"{stem}.{target_format}"
 
-    async def convert_avi_to_mkv(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert AVI to MKV."""
+        input_path, content_digest, owns_input = await self._stage_upload(file, source_format)
         try:
-            if not file.filename.lower().endswith('.avi'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .avi files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_avi_to_mkv(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mkv'
-            return Response(
-                content=result.data,
-                media_type="video/x-matroska",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_avi_to_mkv controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_avi_to_webm(
+            cache_key = self.cache.make_key(content_digest, target_format, options)
+            cached_path = self.cache.get(cache_key)
+            if cached_path is not None:
+                return FileResponse(
+                    cached_path,
+                    media_type=media_type,
+                    filename=filename,
+                    headers=VIDEO_RESPONSE_HEADERS,
+                    background=BackgroundTask(os.unlink, cached_path)
+                )
+
+            if stream and target_format in STREAMING_MUXER_ARGS:
+                # The streamed response removes the input once ffmpeg is done with it
+                cleanup_input, owns_input = owns_input, False
+                return await self._stream_conversion(
+                    input_path, cleanup_input, source_format, target_format, media_type, filename, options
+                )
+
+            async with CONVERSION_SEMAPHORE:
+                result = await service_fn(input_path, options)
+        finally:
+            if owns_input:
+                os.unlink(input_path)
+
+        if result.status != 200:
+            raise ConversionError(result.status, result.message)
+
+        await self.cache.put(cache_key, result.output_path)
+        # FileResponse hands the file to the socket with sendfile where the server supports it
+        return FileResponse(
+            result.output_path,
+            media_type=media_type,
+            filename=filename,
+            headers=VIDEO_RESPONSE_HEADERS,
+            background=BackgroundTask(os.unlink, result.output_path)
+        )
+
+    async def _stream_conversion(
         self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("vp9")
+        input_path: str,
+        cleanup_input: bool,
+        source_format: str,
+        target_format: str,
+        media_type: str,
+        filename: str,
+        options: VideoConversionOptions
     ) -> Response:
-        """Convert AVI to WEBM."""
-        try:
-            if not file.filename.lower().endswith('.avi'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .avi files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_avi_to_webm(file_content, options)
+        """Start a streaming conversion and respond once its first bytes are ready.
+
+        Waiting for the first chunk lets early failures still surface as an error status.
+        """
+        await CONVERSION_SEMAPHORE.acquire()
+        chunks = self.service.convert_stream(source_format, target_format, input_path, options)
+        released = False
+
+        async def release() -> None:
+            # Called from the body's finally and again as the response's background task, since
+            # the body is never entered if the client goes away before streaming starts
+            nonlocal released
+            try:
+                await chunks.aclose()
+            finally:
+                if not released:
+                    released = True
+                    CONVERSION_SEMAPHORE.release()
+                    if cleanup_input:
+                        os.unlink(input_path)
 
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.webm'
-            return Response(
-                content=result.data,
-                media_type="video/webm",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_avi_to_webm controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    # MOV conversions
-    async def convert_mov_to_mp4(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert MOV to MP4."""
         try:
-            if not file.filename.lower().endswith('.mov'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mov files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mov_to_mp4(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mp4'
-            return Response(
-                content=result.data,
-                media_type="video/mp4",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
+            first_chunk = await anext(chunks)
+        except StopAsyncIteration:
+            await release()
+            raise ConversionError(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                f"Error converting {source_format.upper()} to {target_format.upper()}"
+            )
+        except BaseException:
+            await release()
             raise
-        except Exception as e:
-            logger.error("Error in convert_mov_to_mp4 controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_mov_to_avi(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert MOV to AVI."""
-        try:
-            if not file.filename.lower().endswith('.mov'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mov files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
 
-            result = await self.service.convert_mov_to_avi(file_content, options)
+        async def body() -> AsyncIterator[bytes]:
+            try:
+                yield first_chunk
+                async for chunk in chunks:
+                    yield chunk
+            finally:
+                await release()
 
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
+        headers = {**VIDEO_RESPONSE_HEADERS, "Content-Disposition": _content_disposition(filename)}
+        return StreamingResponse(
+            body(), media_type=media_type, headers=headers, background=BackgroundTask(release)
+        )
 
-            filename = file.filename.rsplit('.', 1)[0] + '.avi'
-            return Response(
-                content=result.data,
-                media_type="video/x-msvideo",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mov_to_avi controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_mov_to_mkv(
+    async def _handle_ladder(
         self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
+        file: UploadFile,
+        source_format: str,
+        target_format: str,
+        ladder: List[str],
+        options: VideoConversionOptions
     ) -> Response:
-        """Convert MOV to MKV."""
-        try:
-            if not file.filename.lower().endswith('.mov'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mov files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mov_to_mkv(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mkv'
-            return Response(
-                content=result.data,
-                media_type="video/x-matroska",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mov_to_mkv controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_mov_to_webm(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("vp9")
-    ) -> Response:
-        """Convert MOV to WEBM."""
-        try:
-            if not file.filename.lower().endswith('.mov'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mov files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mov_to_webm(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.webm'
-            return Response(
-                content=result.data,
-                media_type="video/webm",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mov_to_webm controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    # MKV conversions
-    async def convert_mkv_to_mp4(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert MKV to MP4."""
-        try:
-            if not file.filename.lower().endswith('.mkv'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mkv files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mkv_to_mp4(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mp4'
-            return Response(
-                content=result.data,
-                media_type="video/mp4",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mkv_to_mp4 controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_mkv_to_avi(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert MKV to AVI."""
-        try:
-            if not file.filename.lower().endswith('.mkv'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mkv files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mkv_to_avi(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.avi'
-            return Response(
-                content=result.data,
-                media_type="video/x-msvideo",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mkv_to_avi controller", error=str(e))
+        """Encode an uploaded video at every ladder resolution in one ffmpeg run and return a ZIP."""
+        stem, extension = os.path.splitext(file.filename or "")
+        if extension.lower() not in VIDEO_SUFFIXES[source_format]:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Only .{source_format} files are supported"
             )
 
-    async def convert_mkv_to_mov(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert MKV to MOV."""
+        input_path, _, owns_input = await self._stage_upload(file, source_format)
         try:
-            if not file.filename.lower().endswith('.mkv'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mkv files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
+            async with CONVERSION_SEMAPHORE:
+                output_paths = await self.service.convert_ladder(target_format, input_path, ladder, options)
+        finally:
+            if owns_input:
+                os.unlink(input_path)
 
-            result = await self.service.convert_mkv_to_mov(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mov'
-            return Response(
-                content=result.data,
-                media_type="video/quicktime",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mkv_to_mov controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_mkv_to_webm(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("vp9")
-    ) -> Response:
-        """Convert MKV to WEBM."""
         try:
-            if not file.filename.lower().endswith('.mkv'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .mkv files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_mkv_to_webm(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.webm'
-            return Response(
-                content=result.data,
-                media_type="video/webm",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_mkv_to_webm controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    # WEBM conversions
-    async def convert_webm_to_mp4(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert WEBM to MP4."""
-        try:
-            if not file.filename.lower().endswith('.webm'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .webm files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_webm_to_mp4(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mp4'
-            return Response(
-                content=result.data,
-                media_type="video/mp4",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_webm_to_mp4 controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_webm_to_avi(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert WEBM to AVI."""
-        try:
-            if not file.filename.lower().endswith('.webm'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .webm files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_webm_to_avi(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.avi'
-            return Response(
-                content=result.data,
-                media_type="video/x-msvideo",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_webm_to_avi controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_webm_to_mov(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert WEBM to MOV."""
-        try:
-            if not file.filename.lower().endswith('.webm'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .webm files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_webm_to_mov(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mov'
-            return Response(
-                content=result.data,
-                media_type="video/quicktime",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_webm_to_mov controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def convert_webm_to_mkv(
-        self,
-        file: UploadFile = File(...),
-        resolution: str = Form("1920x1080"),
-        bitrate: int = Form(2000),
-        fps: int = Form(30),
-        codec: str = Form("h264")
-    ) -> Response:
-        """Convert WEBM to MKV."""
-        try:
-            if not file.filename.lower().endswith('.webm'):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Only .webm files are supported"
-                )
-
-            file_content = await file.read()
-            options = VideoConversionOptions(
-                resolution=resolution,
-                bitrate=bitrate,
-                fps=fps,
-                codec=codec
-            )
-
-            result = await self.service.convert_webm_to_mkv(file_content, options)
-
-            if result.status != 200:
-                raise HTTPException(
-                    status_code=result.status,
-                    detail=result.message
-                )
-
-            filename = file.filename.rsplit('.', 1)[0] + '.mkv'
-            return Response(
-                content=result.data,
-                media_type="video/x-matroska",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Error in convert_webm_to_mkv controller", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error converting video: {str(e)}"
-            )
-
-    async def get_supported_conversions(self):
+            archive_path = await asyncio.to_thread(_zip_rungs, output_paths, stem, target_format)
+        finally:
+            for output_path in output_paths.values():
+                os.unlink(output_path)
+
+        return FileResponse(
+            archive_path,
+            media_type="application/zip",
+            filename=f"{stem}_ladder.zip",
+            background=BackgroundTask(os.unlink, archive_path)
+        )
+
+    def ladder_endpoint(self, source_format: str, target_format: str) -> Callable[..., Awaitable[Response]]:
+        """Build the FastAPI endpoint for one (source, target) resolution ladder."""
+
+        async def convert_video_ladder(
+            file: UploadFile = File(...),
+            options: VideoConversionOptions = Depends(video_conversion_options),
+            resolutions: str = Form(DEFAULT_LADDER)
+        ) -> Response:
+            ladder = _parse_ladder(resolutions)
+            return await self._handle_ladder(file, source_format, target_format, ladder, options)
+
+        convert_video_ladder.__name__ = f"convert_{source_format}_to_{target_format}_ladder"
+        convert_video_ladder.__doc__ = (
+            f"Convert {source_format.upper()} to {target_format.upper()} at several resolutions."
+        )
+        return convert_video_ladder
+
+    def endpoint(self, source_format: str, target_format: str) -> Callable[..., Awaitable[Response]]:
+        """Build the FastAPI endpoint for one (source, target) conversion."""
+        media_type = VIDEO_MEDIA_TYPES[target_format]
+        service_fn = getattr(self.service, f"convert_{source_format}_to_{target_format}")
+
+        async def convert_video(
+            file: UploadFile = File(...),
+            options: VideoConversionOptions = Depends(video_conversion_options),
+            stream: bool = Form(False)
+        ) -> Response:
+            return await self._handle_conversion(
+                file, source_format, target_format, media_type, options, service_fn, stream
+            )
+
+        convert_video.__name__ = f"convert_{source_format}_to_{target_format}"
+        convert_video.__doc__ = f"Convert {source_format.upper()} to {target_format.upper()}."
+        return convert_video
+
+    async def get_supported_conversions(self) -> Response:
         """Get list of supported video conversions."""
-        return await self.service.get_supported_conversions()
+        # The list and limits never change, so serialize the payload once
+        if self._supported_conversions is None:
+            payload = await self.service.get_supported_conversions()
+            self._supported_conversions = orjson.dumps(payload)
+
+        return Response(content=self._supported_conversions, media_type="application/json")
 
 
 # Global instance
@@ -3,25 +3,192 @@ Video conversion service.
 Handles MP4, AVI, MOV, MKV, WEBM conversions with security limits.
 """
 
-import io
+import asyncio
+import functools
+import itertools
+import json
 import os
+import shutil
+import subprocess
 import tempfile
-from typing import Optional
+import threading
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import structlog
-from pydub import AudioSegment
-from pydub.utils import which
-
-# Note: moviepy import is commented out due to dependency issues
-# from moviepy.editor import VideoFileClip
 
+from app.core.config import settings
+from app.core.exceptions import ConversionError
 from .types import VideoServiceResponse, VideoConversionOptions
 
 logger = structlog.get_logger(__name__)
 
+# Component field on conversion events; passed per call because binding at import
+# time would capture structlog's configuration before setup_logging() runs
+LOG_COMPONENT = 'video_converter'
+
+# Resolved once so spawning a job doesn't repeat the PATH search
+FFMPEG_BINARY = shutil.which('ffmpeg') or 'ffmpeg'
+FFPROBE_BINARY = shutil.which('ffprobe') or 'ffprobe'
+
+# CPUs ffmpeg may run on: all but the first, which is left to the event loop
+_AVAILABLE_CPUS = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+FFMPEG_CPUS = frozenset(_AVAILABLE_CPUS[1:]) if len(_AVAILABLE_CPUS) > 1 else None
+FFMPEG_CPU_COUNT = len(FFMPEG_CPUS) if FFMPEG_CPUS else (os.cpu_count() or 1)
+
+# Niceness for ffmpeg so encodes yield to the event loop serving other requests
+FFMPEG_NICE = 5
+
+# nice/taskset wrappers apply the niceness and CPU set before ffmpeg starts; changing them
+# on the pid after spawning races with ffmpeg creating its worker threads
+_NICE_BINARY = shutil.which('nice')
+_TASKSET_BINARY = shutil.which('taskset')
+FFMPEG_LAUNCH_PREFIX = [
+    *([_NICE_BINARY, '-n', str(FFMPEG_NICE)] if _NICE_BINARY else []),
+    *([_TASKSET_BINARY, '-c', ','.join(map(str, sorted(FFMPEG_CPUS)))] if _TASKSET_BINARY and FFMPEG_CPUS else []),
+]
+
+# Conversions allowed to run at once in this worker
+MAX_CONCURRENT_CONVERSIONS = settings.VIDEO_MAX_CONCURRENT_CONVERSIONS or os.cpu_count() or 1
+
+# x264/x265 preset when none is requested: ~3x the throughput of "medium" for ~10% more bitrate
+DEFAULT_X264_PRESET = 'veryfast'
+
+# Speed/quality preset for each quality level, for x264/x265 and for NVENC
+X264_PRESET_BY_QUALITY = {
+    'low': 'ultrafast',
+    'medium': DEFAULT_X264_PRESET,
+    'high': 'medium',
+    'ultra': 'slow',
+}
+NVENC_PRESET_BY_QUALITY = {
+    'low': 'p1',
+    'medium': 'p4',
+    'high': 'p6',
+    'ultra': 'p7',
+}
+
+# Software encoder/filter threads per job when a concurrency limit is configured, so concurrent
+# jobs share ffmpeg's CPUs instead of oversubscribing them; otherwise ffmpeg picks its own count
+FFMPEG_THREADS = (
+    max(1, FFMPEG_CPU_COUNT // settings.VIDEO_MAX_CONCURRENT_CONVERSIONS)
+    if settings.VIDEO_MAX_CONCURRENT_CONVERSIONS else None
+)
+FFMPEG_THREAD_ARGS = ['-threads', str(FFMPEG_THREADS)] if FFMPEG_THREADS else []
+
+# Software encoder for each requestable video codec
+VIDEO_CODEC_ENCODERS = {
+    'h264': 'libx264',
+    'hevc': 'libx265',
+    'vp9': 'libvpx-vp9',
+    'av1': 'libaom-av1',
+}
+
+# Software video encoder each target container gets when no codec is requested
+CONTAINER_DEFAULT_ENCODERS = {
+    'mp4': 'libx264',
+    'mov': 'libx264',
+    'mkv': 'libx264',
+    'avi': 'libx264',
+    'flv': 'libx264',
+    'webm': 'libvpx-vp9',
+    'wmv': 'wmv2',
+}
+
+# SVT-AV1 preset: its AVX2/AVX-512 kernels encode several times faster than libvpx-vp9 here
+SVTAV1_PRESET = '8'
+
+# Frame size for each named resolution; explicit WIDTHxHEIGHT values are passed through
+RESOLUTION_SIZES = {
+    '480p': '854x480',
+    '720p': '1280x720',
+    '1080p': '1920x1080',
+    '4k': '3840x2160',
+}
+
+# Scaler options fitting the frame inside the requested box: aspect ratio kept, never
+# upscaled past the source, dimensions rounded to the even sizes 4:2:0 encoders need
+SCALE_BOX_ARGS = (
+    "w='min({width},iw)':h='min({height},ih)'"
+    ":force_original_aspect_ratio=decrease:force_divisible_by=2"
+)
+
+# Hardware encoder for each software encoder that has a GPU equivalent, per backend
+HW_ENCODERS = {
+    'nvenc': {'libx264': 'h264_nvenc', 'libx265': 'hevc_nvenc'},
+    'vaapi': {'libx264': 'h264_vaapi', 'libx265': 'hevc_vaapi'},
+    'qsv': {'libx264': 'h264_qsv', 'libx265': 'hevc_qsv'},
+}
+
+# Render node used for VAAPI encoding
+VAAPI_DEVICE = '/dev/dri/renderD128'
+
+# Input-side ffmpeg arguments that set up each backend's device and frame upload
+HW_INPUT_ARGS = {
+    'vaapi': [
+        '-init_hw_device', f'vaapi=va:{VAAPI_DEVICE}',
+        '-hwaccel', 'vaapi', '-hwaccel_device', 'va', '-hwaccel_output_format', 'vaapi',
+        '-filter_hw_device', 'va',
+    ],
+    'qsv': ['-init_hw_device', 'qsv=qs', '-filter_hw_device', 'qs'],
+}
+
+# Filter that gets decoded frames onto each backend's device
+HW_UPLOAD_FILTERS = {
+    'vaapi': 'format=nv12|vaapi,hwupload',
+    'qsv': 'format=nv12,hwupload=extra_hw_frames=64',
+}
+
+# Containers that only accept certain audio codecs, with the encoder to fall back to
+RESTRICTED_AUDIO_CODECS = {
+    'webm': ({'opus', 'vorbis', 'libopus', 'libvorbis'}, 'libopus'),
+}
+
+# Muxer arguments that let each target container be written to a non-seekable pipe
+STREAMING_MUXER_ARGS = {
+    'mp4': ['-f', 'mp4', '-movflags', 'frag_keyframe+empty_moov+default_base_moof'],
+    'mov': ['-f', 'mov', '-movflags', 'frag_keyframe+empty_moov+default_base_moof'],
+    'mkv': ['-f', 'matroska', '-live', '1'],
+    'webm': ['-f', 'webm', '-live', '1'],
+}
+
+# Muxer arguments for file outputs served to clients: put the MP4/MOV index first so
+# playback can start before the download finishes (needs a seekable output)
+FILE_MUXER_ARGS = {
+    'mp4': ['-movflags', '+faststart'],
+    'mov': ['-movflags', '+faststart'],
+}
+
+# Read size when relaying ffmpeg's output pipe
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Preference order when hw_accel is "auto"
+HW_BACKEND_PRIORITY = ('nvenc', 'vaapi', 'qsv')
+
+# Requestable video codecs each target container can hold
+CONTAINER_VIDEO_CODECS = {
+    'mp4': {'h264', 'hevc', 'vp9', 'av1'},
+    'mov': {'h264', 'hevc'},
+    'mkv': {'h264', 'hevc', 'vp9', 'av1'},
+    'webm': {'vp9', 'av1'},
+    'avi': {'h264'},
+    'flv': {'h264'},
+}
+
+# Codecs each container can carry unchanged; None means any codec
+REMUX_COMPATIBLE_CODECS = {
+    'mp4': {'h264', 'hevc', 'av1', 'aac', 'mp3'},
+    'mov': {'h264', 'hevc', 'prores', 'aac', 'mp3', 'alac'},
+    'mkv': None,
+    'webm': {'vp8', 'vp9', 'av1', 'opus', 'vorbis'},
+    'flv': {'h264', 'aac', 'mp3'},
+}
+
 
 class VideoConverterService:
     """Service for converting video formats with security restrictions."""
 
+    # Options are frozen, so one default instance can be shared by every request
+    _DEFAULT_OPTIONS = VideoConversionOptions()
+
     def __init__(self):
         self.supported_conversions = {
             'mp4': ['avi', 'mov', 'mkv', 'webm', 'wmv', 'flv'],
@@ -39,6 +206,20 @@ class VideoConverterService:
         self.ABSOLUTE_MAX_DURATION = 600  # 10 minutes
         self.ABSOLUTE_MAX_FILE_SIZE = 500 * 1024 * 1024  # 500MB
 
+        # Hardware encoder backends usable on this host, probed lazily on first use
+        self._hw_backends: Optional[frozenset] = None
+
+        # Whether this ffmpeg build ships libsvtav1, probed lazily on first use
+        self._has_svtav1: Optional[bool] = None
+
+        # Consumer GPUs cap concurrent NVENC sessions; jobs beyond this encode on the CPU
+        self.MAX_NVENC_SESSIONS = 3
+        self._nvenc_sessions = [
+            threading.BoundedSemaphore(self.MAX_NVENC_SESSIONS)
+            for _ in range(max(1, settings.VIDEO_GPU_COUNT))
+        ]
+        self._gpu_rotation = itertools.count()
+
     def can_convert(self, source_format: str, target_format: str) -> bool:
         """Check if conversion is supported."""
         source_format = source_format.lower().replace('.', '')
@@ -51,9 +232,9 @@ class VideoConverterService:
         source_format = source_format.lower().replace('.', '')
         return self.supported_conversions.get(source_format, [])
 
-    def _validate_file_limits(self, file_buffer: bytes, options: VideoConversionOptions) -> tuple[bool, str]:
-        """Validate file size and estimated duration limits."""
-        file_size = len(file_buffer)
+    def _validate_file_limits(self, input_path: str, options: VideoConversionOptions) -> tuple[bool, str]:
+        """Validate file size limits; duration is checked against the probe in _validate_duration."""
+        file_size = os.path.getsize(input_path)
         
         # Check file size
         if file_size > options.max_file_size:
@@ -62,1382 +243,596 @@ class VideoConverterService:
         if file_size > self.ABSOLUTE_MAX_FILE_SIZE:
             return False, f"File size ({file_size / (1024*1024):.1f}MB) exceeds absolute maximum size ({self.ABSOLUTE_MAX_FILE_SIZE / (1024*1024):.1f}MB)"
         
-        # For now, we'll do basic validation
-        # In a real implementation, you'd use ffprobe to get actual duration
         return True, "File validation passed"
 
-    def _get_ffmpeg_params(self, target_format: str, options: VideoConversionOptions) -> str:
-        """Get FFmpeg parameters for video conversion."""
-        params = []
-        
-        # Video codec and quality
-        if target_format in ['mp4', 'mov']:
-            params.append('-c:v libx264')
-        elif target_format == 'webm':
-            params.append('-c:v libvpx-vp9')
-        elif target_format == 'mkv':
-            params.append('-c:v libx264')
-        elif target_format == 'avi':
-            params.append('-c:v libx264')
-        elif target_format == 'wmv':
-            params.append('-c:v wmv2')
-        elif target_format == 'flv':
-            params.append('-c:v libx264')
-        
-        # Audio codec
-        params.append(f'-c:a {options.audio_codec}')
-        
-        # Bitrate
-        params.append(f'-b:v {options.bitrate}')
-        params.append(f'-b:a {options.audio_bitrate}')
-        
-        # Resolution
-        if options.resolution == '480p':
-            params.append('-s 854x480')
-        elif options.resolution == '720p':
-            params.append('-s 1280x720')
-        elif options.resolution == '1080p':
-            params.append('-s 1920x1080')
-        elif options.resolution == '4k':
-            params.append('-s 3840x2160')
-        
-        # FPS
-        params.append(f'-r {options.fps}')
-        
-        # Duration limit
-        params.append(f'-t {options.max_duration}')
-        
-        # Speed adjustment
-        if options.speed != 1.0:
-            params.append(f'-filter:v "setpts={1/options.speed}*PTS"')
-            params.append(f'-filter:a "atempo={options.speed}"')
-        
-        # Volume adjustment
-        if options.volume != 1.0:
-            params.append(f'-filter:a "volume={options.volume}"')
-        
-        return ' '.join(params)
-
-    def _convert_with_ffmpeg(self, input_buffer: bytes, target_format: str, options: VideoConversionOptions) -> bytes:
-        """Convert video using FFmpeg command line."""
-        import subprocess
-        
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(suffix=f'.{target_format}', delete=False) as output_file:
-            with tempfile.NamedTemporaryFile(delete=False) as input_file:
-                input_file.write(input_buffer)
-                input_file.flush()
-                
-                # Build FFmpeg command
-                ffmpeg_cmd = [
-                    'ffmpeg',
-                    '-i', input_file.name,
-                    '-y',  # Overwrite output file
-                ]
-                
-                # Add conversion parameters
-                ffmpeg_params = self._get_ffmpeg_params(target_format, options)
-                ffmpeg_cmd.extend(ffmpeg_params.split())
-                ffmpeg_cmd.append(output_file.name)
-                
-                try:
-                    # Run FFmpeg
-                    result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True, timeout=300)
-                    
-                    if result.returncode != 0:
-                        raise Exception(f"FFmpeg error: {result.stderr}")
-                    
-                    # Read output file
-                    with open(output_file.name, 'rb') as f:
-                        output_data = f.read()
-                    
-                    # Clean up
-                    os.unlink(input_file.name)
-                    os.unlink(output_file.name)
-                    
-                    return output_data
-                    
-                except subprocess.TimeoutExpired:
-                    # Clean up on timeout
-                    try:
-                        os.unlink(input_file.name)
-                        os.unlink(output_file.name)
-                    except:
-                        pass
-                    raise Exception("Video conversion timed out (5 minutes limit)")
-                except Exception as e:
-                    # Clean up on error
-                    try:
-                        os.unlink(input_file.name)
-                        os.unlink(output_file.name)
-                    except:
-                        pass
-                    raise e
-
-    # MP4 conversions
-    async def convert_mp4_to_avi(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MP4 to AVI."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            avi_content = self._convert_with_ffmpeg(file_buffer, 'avi', options)
-
-            logger.info("MP4 to AVI conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MP4 converted to AVI successfully",
-                data=avi_content,
-                format="avi",
-                file_size=len(avi_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MP4 to AVI conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MP4 to AVI",
-                error=str(e)
-            )
-
-    async def convert_mp4_to_mov(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MP4 to MOV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            mov_content = self._convert_with_ffmpeg(file_buffer, 'mov', options)
-
-            logger.info("MP4 to MOV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MP4 converted to MOV successfully",
-                data=mov_content,
-                format="mov",
-                file_size=len(mov_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MP4 to MOV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MP4 to MOV",
-                error=str(e)
-            )
-
-    async def convert_mp4_to_mkv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MP4 to MKV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            mkv_content = self._convert_with_ffmpeg(file_buffer, 'mkv', options)
-
-            logger.info("MP4 to MKV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MP4 converted to MKV successfully",
-                data=mkv_content,
-                format="mkv",
-                file_size=len(mkv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MP4 to MKV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MP4 to MKV",
-                error=str(e)
-            )
-
-    async def convert_mp4_to_webm(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MP4 to WEBM."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            webm_content = self._convert_with_ffmpeg(file_buffer, 'webm', options)
-
-            logger.info("MP4 to WEBM conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MP4 converted to WEBM successfully",
-                data=webm_content,
-                format="webm",
-                file_size=len(webm_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MP4 to WEBM conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MP4 to WEBM",
-                error=str(e)
-            )
-
-    async def convert_mp4_to_wmv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MP4 to WMV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            wmv_content = self._convert_with_ffmpeg(file_buffer, 'wmv', options)
-
-            logger.info("MP4 to WMV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MP4 converted to WMV successfully",
-                data=wmv_content,
-                format="wmv",
-                file_size=len(wmv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MP4 to WMV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MP4 to WMV",
-                error=str(e)
-            )
-
-    async def convert_mp4_to_flv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MP4 to FLV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            flv_content = self._convert_with_ffmpeg(file_buffer, 'flv', options)
-
-            logger.info("MP4 to FLV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MP4 converted to FLV successfully",
-                data=flv_content,
-                format="flv",
-                file_size=len(flv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MP4 to FLV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MP4 to FLV",
-                error=str(e)
-            )
+    def _probe_hw_backend(self, backend: str) -> bool:
+        """Run a tiny test encode to check whether a hardware backend really works here."""
+        # Builds often list hardware encoders without a usable device behind them
+        probe_cmd = [FFMPEG_BINARY, '-hide_banner', '-loglevel', 'error']
+        probe_cmd.extend(HW_INPUT_ARGS.get(backend, []))
+        probe_cmd.extend(['-f', 'lavfi', '-i', 'nullsrc=s=256x256:d=0.1'])
+        if backend in HW_UPLOAD_FILTERS:
+            probe_cmd.extend(['-vf', HW_UPLOAD_FILTERS[backend]])
+        probe_cmd.extend(['-c:v', HW_ENCODERS[backend]['libx264'], '-f', 'null', '-'])
 
-    # AVI conversions
-    async def convert_avi_to_mp4(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert AVI to MP4."""
         try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
+            result = subprocess.run(probe_cmd, capture_output=True, timeout=30)
+            return result.returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+
+    def _available_hw_backends(self) -> frozenset:
+        """Hardware encoder backends that work on this host, probed once."""
+        if self._hw_backends is None:
+            self._hw_backends = frozenset(
+                backend for backend in HW_BACKEND_PRIORITY if self._probe_hw_backend(backend)
+            )
+            logger.info("Hardware encoders probed", available=sorted(self._hw_backends))
+
+        return self._hw_backends
+
+    def _svtav1_available(self) -> bool:
+        """Whether this ffmpeg build has the SVT-AV1 encoder, probed once."""
+        if self._has_svtav1 is None:
+            try:
+                result = subprocess.run(
+                    [FFMPEG_BINARY, '-hide_banner', '-encoders'], capture_output=True, timeout=30
                 )
-
-            # Convert using FFmpeg
-            mp4_content = self._convert_with_ffmpeg(file_buffer, 'mp4', options)
-
-            logger.info("AVI to MP4 conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="AVI converted to MP4 successfully",
-                data=mp4_content,
-                format="mp4",
-                file_size=len(mp4_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("AVI to MP4 conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting AVI to MP4",
-                error=str(e)
-            )
-
-    async def convert_avi_to_mov(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert AVI to MOV."""
+                self._has_svtav1 = b' libsvtav1 ' in result.stdout
+            except (OSError, subprocess.TimeoutExpired):
+                self._has_svtav1 = False
+            logger.info("SVT-AV1 encoder probed", available=self._has_svtav1)
+
+        return self._has_svtav1
+
+    async def warm_up(self) -> None:
+        """Run the one-off ffmpeg capability probes ahead of the first request."""
+        await asyncio.to_thread(self._available_hw_backends)
+        await asyncio.to_thread(self._svtav1_available)
+
+    def _select_hw_backend(self, video_codec: str, options: VideoConversionOptions) -> Optional[str]:
+        """Pick the hardware backend to encode with, or None for the software encoder."""
+        if options.hw_accel == 'none':
+            return None
+
+        candidates = HW_BACKEND_PRIORITY if options.hw_accel == 'auto' else (options.hw_accel,)
+        available = self._available_hw_backends()
+        for backend in candidates:
+            if backend in available and video_codec in HW_ENCODERS[backend]:
+                return backend
+
+        return None
+
+    async def _run_process(self, cmd: list, timeout: float) -> Tuple[int, bytes, bytes]:
+        """Run a command without blocking the event loop.
+
+        The process is killed if it outlives the timeout or the awaiting request is cancelled.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *FFMPEG_LAUNCH_PREFIX, *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True  # Keep terminal signals aimed at the server away from ffmpeg
+        )
         try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            mov_content = self._convert_with_ffmpeg(file_buffer, 'mov', options)
-
-            logger.info("AVI to MOV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="AVI converted to MOV successfully",
-                data=mov_content,
-                format="mov",
-                file_size=len(mov_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("AVI to MOV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting AVI to MOV",
-                error=str(e)
-            )
-
-    async def convert_avi_to_mkv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert AVI to MKV."""
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except BaseException:
+            process.kill()
+            await process.wait()
+            raise
+
+        return process.returncode, stdout, stderr
+
+    async def _probe_media(self, input_path: str) -> Optional[Dict]:
+        """Read a file's stream codecs and duration with a single ffprobe call.
+
+        Returns a dict with 'video' and 'audio' codec name lists and 'duration'
+        in seconds (None if the container doesn't report one), or None when the
+        file couldn't be probed.
+        """
+        probe_cmd = [
+            FFPROBE_BINARY, '-v', 'error',
+            '-show_entries', 'stream=codec_name,codec_type:format=duration',
+            '-of', 'json', input_path,
+        ]
         try:
-            if options is None:
-                options = VideoConversionOptions()
+            returncode, stdout, stderr = await self._run_process(probe_cmd, timeout=30)
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.warning("Media probe failed", error=str(e))
+            return None
+        if returncode != 0:
+            logger.warning("Media probe failed", error=stderr.decode(errors='replace'))
+            return None
 
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
+        probe = json.loads(stdout)
+        media = {'video': [], 'audio': [], 'duration': None}
+        for stream in probe.get('streams', []):
+            if stream.get('codec_type') in ('video', 'audio'):
+                media[stream['codec_type']].append(stream.get('codec_name'))
 
-            # Convert using FFmpeg
-            mkv_content = self._convert_with_ffmpeg(file_buffer, 'mkv', options)
-
-            logger.info("AVI to MKV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="AVI converted to MKV successfully",
-                data=mkv_content,
-                format="mkv",
-                file_size=len(mkv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
+        duration = probe.get('format', {}).get('duration')
+        if duration not in (None, 'N/A'):
+            media['duration'] = float(duration)
 
-        except Exception as e:
-            logger.error("AVI to MKV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting AVI to MKV",
-                error=str(e)
-            )
+        return media
 
-    async def convert_avi_to_webm(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert AVI to WEBM."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
+    def _validate_duration(self, media: Optional[Dict], options: VideoConversionOptions) -> tuple[bool, str]:
+        """Reject inputs longer than the allowed duration before any encoding starts."""
+        duration = media['duration'] if media else None
+        if duration is not None and duration > options.max_duration:
+            return False, f"Video duration ({duration:.0f}s) exceeds maximum allowed duration ({options.max_duration}s)"
 
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
+        return True, "Duration validation passed"
 
-            # Convert using FFmpeg
-            webm_content = self._convert_with_ffmpeg(file_buffer, 'webm', options)
-
-            logger.info("AVI to WEBM conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="AVI converted to WEBM successfully",
-                data=webm_content,
-                format="webm",
-                file_size=len(webm_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
+    def _remux_plan(self, media: Optional[Dict], target_format: str) -> Optional[str]:
+        """Decide how much of the input can be copied into the target container as-is.
 
-        except Exception as e:
-            logger.error("AVI to WEBM conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting AVI to WEBM",
-                error=str(e)
-            )
+        Returns 'all' when every stream can be copied, 'video' when only the
+        audio has to be re-encoded, or None when the video has to be re-encoded.
+        """
+        if media is None or target_format not in REMUX_COMPATIBLE_CODECS:
+            return None
 
-    async def convert_avi_to_wmv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert AVI to WMV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
+        compatible = REMUX_COMPATIBLE_CODECS[target_format]
 
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
+        def fits(names: list) -> bool:
+            return compatible is None or all(name in compatible for name in names)
 
-            # Convert using FFmpeg
-            wmv_content = self._convert_with_ffmpeg(file_buffer, 'wmv', options)
-
-            logger.info("AVI to WMV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="AVI converted to WMV successfully",
-                data=wmv_content,
-                format="wmv",
-                file_size=len(wmv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
+        if not media['video'] or not fits(media['video']):
+            return None
 
-        except Exception as e:
-            logger.error("AVI to WMV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting AVI to WMV",
-                error=str(e)
-            )
+        return 'all' if fits(media['audio']) else 'video'
 
-    async def convert_avi_to_flv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert AVI to FLV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            flv_content = self._convert_with_ffmpeg(file_buffer, 'flv', options)
-
-            logger.info("AVI to FLV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="AVI converted to FLV successfully",
-                data=flv_content,
-                format="flv",
-                file_size=len(flv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("AVI to FLV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting AVI to FLV",
-                error=str(e)
-            )
-
-    # MOV conversions
-    async def convert_mov_to_mp4(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MOV to MP4."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
+    def _audio_encoder(self, target_format: str, options: VideoConversionOptions) -> str:
+        """Pick the audio encoder, falling back when the container rejects the requested codec."""
+        allowed, fallback = RESTRICTED_AUDIO_CODECS.get(target_format, (None, None))
+        if allowed is not None and options.audio_codec not in allowed:
+            return fallback
 
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
+        return options.audio_codec
 
-            # Convert using FFmpeg
-            mp4_content = self._convert_with_ffmpeg(file_buffer, 'mp4', options)
-
-            logger.info("MOV to MP4 conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MOV converted to MP4 successfully",
-                data=mp4_content,
-                format="mp4",
-                file_size=len(mp4_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
+    def _acquire_nvenc_device(self) -> Optional[int]:
+        """Take an NVENC session on the next GPU with a free one, rotating the starting GPU per job."""
+        start = next(self._gpu_rotation)
+        for offset in range(len(self._nvenc_sessions)):
+            device = (start + offset) % len(self._nvenc_sessions)
+            if self._nvenc_sessions[device].acquire(blocking=False):
+                return device
 
-        except Exception as e:
-            logger.error("MOV to MP4 conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MOV to MP4",
-                error=str(e)
-            )
+        return None
 
-    async def convert_mov_to_avi(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MOV to AVI."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
+    def _video_encoder(self, target_format: str, options: VideoConversionOptions) -> str:
+        """Pick the software video encoder for a target container."""
+        video_codec = CONTAINER_DEFAULT_ENCODERS[target_format]
 
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
+        # A codec the container cannot hold (such as h264 for WebM) is no preference
+        requested = options.codec if options.codec in CONTAINER_VIDEO_CODECS.get(target_format, ()) else None
+        if requested is not None:
+            video_codec = VIDEO_CODEC_ENCODERS[requested]
 
-            # Convert using FFmpeg
-            avi_content = self._convert_with_ffmpeg(file_buffer, 'avi', options)
-
-            logger.info("MOV to AVI conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MOV converted to AVI successfully",
-                data=avi_content,
-                format="avi",
-                file_size=len(avi_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
+        # AV1 requests, and WebM targets without a codec preference, use SVT-AV1 when the build has it
+        wants_av1 = requested == 'av1' or (target_format == 'webm' and requested is None)
+        if wants_av1 and self._svtav1_available():
+            video_codec = 'libsvtav1'
 
-        except Exception as e:
-            logger.error("MOV to AVI conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MOV to AVI",
-                error=str(e)
-            )
+        return video_codec
 
-    async def convert_mov_to_mkv(
+    @functools.lru_cache(maxsize=64)
+    def _get_ffmpeg_params(
         self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MOV to MKV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            mkv_content = self._convert_with_ffmpeg(file_buffer, 'mkv', options)
-
-            logger.info("MOV to MKV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MOV converted to MKV successfully",
-                data=mkv_content,
-                format="mkv",
-                file_size=len(mkv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MOV to MKV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MOV to MKV",
-                error=str(e)
-            )
-
-    async def convert_mov_to_webm(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MOV to WEBM."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            webm_content = self._convert_with_ffmpeg(file_buffer, 'webm', options)
-
-            logger.info("MOV to WEBM conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MOV converted to WEBM successfully",
-                data=webm_content,
-                format="webm",
-                file_size=len(webm_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MOV to WEBM conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MOV to WEBM",
-                error=str(e)
-            )
-
-    async def convert_mov_to_wmv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MOV to WMV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            wmv_content = self._convert_with_ffmpeg(file_buffer, 'wmv', options)
-
-            logger.info("MOV to WMV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MOV converted to WMV successfully",
-                data=wmv_content,
-                format="wmv",
-                file_size=len(wmv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MOV to WMV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MOV to WMV",
-                error=str(e)
-            )
-
-    async def convert_mov_to_flv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MOV to FLV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            flv_content = self._convert_with_ffmpeg(file_buffer, 'flv', options)
-
-            logger.info("MOV to FLV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MOV converted to FLV successfully",
-                data=flv_content,
-                format="flv",
-                file_size=len(flv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MOV to FLV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MOV to FLV",
-                error=str(e)
-            )
-
-    # MKV conversions
-    async def convert_mkv_to_mp4(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MKV to MP4."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            mp4_content = self._convert_with_ffmpeg(file_buffer, 'mp4', options)
-
-            logger.info("MKV to MP4 conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MKV converted to MP4 successfully",
-                data=mp4_content,
-                format="mp4",
-                file_size=len(mp4_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MKV to MP4 conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MKV to MP4",
-                error=str(e)
-            )
-
-    async def convert_mkv_to_avi(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MKV to AVI."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            avi_content = self._convert_with_ffmpeg(file_buffer, 'avi', options)
-
-            logger.info("MKV to AVI conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MKV converted to AVI successfully",
-                data=avi_content,
-                format="avi",
-                file_size=len(avi_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MKV to AVI conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MKV to AVI",
-                error=str(e)
-            )
-
-    async def convert_mkv_to_mov(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MKV to MOV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            mov_content = self._convert_with_ffmpeg(file_buffer, 'mov', options)
-
-            logger.info("MKV to MOV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MKV converted to MOV successfully",
-                data=mov_content,
-                format="mov",
-                file_size=len(mov_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MKV to MOV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MKV to MOV",
-                error=str(e)
-            )
-
-    async def convert_mkv_to_webm(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MKV to WEBM."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            webm_content = self._convert_with_ffmpeg(file_buffer, 'webm', options)
-
-            logger.info("MKV to WEBM conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MKV converted to WEBM successfully",
-                data=webm_content,
-                format="webm",
-                file_size=len(webm_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
+        target_format: str,
+        options: VideoConversionOptions,
+        hw_backend: Optional[str] = None
+    ) -> Tuple[str, ...]:
+        """Get FFmpeg parameters for video conversion.
+
+        Options are frozen and hashable, so the argument list is built once per
+        (target_format, options, hw_backend) combination.
+        """
+        params = []
+        video_filters = []
+        if hw_backend in HW_UPLOAD_FILTERS:
+            video_filters.append(HW_UPLOAD_FILTERS[hw_backend])
+        
+        # Video codec and quality
+        video_codec = self._video_encoder(target_format, options)
+        if hw_backend == 'nvenc':
+            params.extend([
+                '-c:v', HW_ENCODERS[hw_backend][video_codec],
+                '-preset', NVENC_PRESET_BY_QUALITY.get(options.quality, 'p4'),
+            ])
+        elif hw_backend:
+            params.extend(['-c:v', HW_ENCODERS[hw_backend][video_codec]])
+        elif video_codec == 'libsvtav1':
+            params.extend([
+                '-c:v', 'libsvtav1', '-preset', SVTAV1_PRESET, '-svtav1-params', 'tune=0',
+            ])
+        elif video_codec == 'libaom-av1':
+            # libaom's defaults are orders of magnitude slower than real time
+            params.extend([
+                '-c:v', 'libaom-av1', '-cpu-used', '6', '-row-mt', '1', *FFMPEG_THREAD_ARGS,
+            ])
+        elif video_codec == 'libvpx-vp9':
+            params.extend([
+                '-c:v', 'libvpx-vp9', '-row-mt', '1', '-tile-columns', '2', *FFMPEG_THREAD_ARGS,
+            ])
+        elif video_codec in ('libx264', 'libx265'):
+            params.extend([
+                '-c:v', video_codec,
+                '-preset', options.preset or X264_PRESET_BY_QUALITY.get(options.quality, DEFAULT_X264_PRESET),
+                *FFMPEG_THREAD_ARGS,
+            ])
+        else:
+            params.extend(['-c:v', video_codec, *FFMPEG_THREAD_ARGS])
+        
+        # Audio codec
+        params.extend(['-c:a', self._audio_encoder(target_format, options)])
+        
+        # Bitrate
+        params.extend(['-b:v', options.bitrate])
+        params.extend(['-b:a', options.audio_bitrate])
+        
+        # Resolution; an unknown label is an error rather than silently skipping the scale
+        size = None
+        if options.resolution:
+            size = RESOLUTION_SIZES.get(options.resolution)
+            if size is None:
+                if 'x' not in options.resolution:
+                    raise ValueError(f"Unsupported resolution: {options.resolution}")
+                size = options.resolution  # Explicit WIDTHxHEIGHT
+        
+        # Duration limit
+        params.extend(['-t', str(options.max_duration)])
+        
+        # Speed adjustment
+        audio_filters = []
+        if options.speed != 1.0:
+            video_filters.append(f'setpts={1/options.speed}*PTS')
+            audio_filters.append(f'atempo={options.speed}')
+
+        # Only scale when a size was asked for; otherwise the source frame size is kept
+        if size:
+            width, height = size.split('x')
+            box = SCALE_BOX_ARGS.format(width=width, height=height)
+            if hw_backend:
+                # Frames stay in GPU memory between decoding/upload, scaling and encoding
+                video_filters.append(f"scale_{'cuda' if hw_backend == 'nvenc' else hw_backend}={box}")
+            else:
+                video_filters.append(f'scale={box}')
+            # Even-size rounding would otherwise leave a fractional sample aspect ratio
+            video_filters.append('setsar=1')
+        
+        # FPS
+        video_filters.append(f'fps={options.fps}')
+        if not hw_backend:
+            # Convert the pixel format in the same chain so players get 4:2:0 output
+            video_filters.append('format=yuv420p')
+        
+        # Volume adjustment
+        if options.volume != 1.0:
+            audio_filters.append(f'volume={options.volume}')
 
-        except Exception as e:
-            logger.error("MKV to WEBM conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MKV to WEBM",
-                error=str(e)
-            )
+        # One chain per stream, so no filter overrides another and each graph is built once
+        params.extend(['-vf', ','.join(video_filters)])
+        if audio_filters:
+            params.extend(['-af', ','.join(audio_filters)])
+        
+        return tuple(params)
 
-    async def convert_mkv_to_wmv(
+    async def _build_ffmpeg_command(
         self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MKV to WMV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            wmv_content = self._convert_with_ffmpeg(file_buffer, 'wmv', options)
-
-            logger.info("MKV to WMV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MKV converted to WMV successfully",
-                data=wmv_content,
-                format="wmv",
-                file_size=len(wmv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MKV to WMV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MKV to WMV",
-                error=str(e)
-            )
-
-    async def convert_mkv_to_flv(
+        input_path: str,
+        target_format: str,
+        options: VideoConversionOptions,
+        output_args: list,
+        media: Optional[Dict] = None
+    ) -> Tuple[list, Optional[int]]:
+        """Build the FFmpeg command line for a conversion.
+
+        Returns the command and the NVENC device whose session the caller must
+        release once ffmpeg exits, if one was taken.
+        """
+        remux = None
+        if options.allow_remux:
+            remux = self._remux_plan(media, target_format)
+
+        hw_backend = None
+        if not remux:
+            hw_backend = self._select_hw_backend(self._video_encoder(target_format, options), options)
+
+        # Take a free NVENC session if there is one, otherwise encode in software
+        nvenc_device = None
+        if hw_backend == 'nvenc':
+            nvenc_device = self._acquire_nvenc_device()
+            if nvenc_device is None:
+                hw_backend = None
+
+        # Build FFmpeg command
+        ffmpeg_cmd = [FFMPEG_BINARY, '-y', '-loglevel', 'error']
+        if FFMPEG_THREADS and not hw_backend and not remux:
+            # Filters default to one thread per core; keep them to this job's share like the encoder
+            ffmpeg_cmd.extend(['-filter_threads', str(FFMPEG_THREADS)])
+        if hw_backend == 'nvenc':
+            # Decode on NVDEC as well and keep the decoded frames in that GPU's memory
+            ffmpeg_cmd.extend([
+                '-hwaccel', 'cuda',
+                '-hwaccel_device', str(nvenc_device),
+                '-hwaccel_output_format', 'cuda',
+            ])
+        elif hw_backend:
+            ffmpeg_cmd.extend(HW_INPUT_ARGS[hw_backend])
+        ffmpeg_cmd.extend(['-i', input_path])
+        
+        # Add conversion parameters
+        if remux == 'all':
+            # Container change only: copy the streams, drop subtitles/data
+            ffmpeg_params = ('-c', 'copy', '-sn', '-dn', '-t', str(options.max_duration))
+        elif remux == 'video':
+            # Copy the video as-is and only re-encode the audio the container can't hold
+            ffmpeg_params = (
+                '-c:v', 'copy',
+                '-c:a', self._audio_encoder(target_format, options), '-b:a', options.audio_bitrate,
+                '-sn', '-dn', '-t', str(options.max_duration),
+            )
+        else:
+            ffmpeg_params = self._get_ffmpeg_params(target_format, options, hw_backend)
+        ffmpeg_cmd.extend(ffmpeg_params)
+        ffmpeg_cmd.extend(output_args)
+
+        return ffmpeg_cmd, nvenc_device
+
+    async def _convert_with_ffmpeg(
         self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert MKV to FLV."""
+        input_path: str,
+        target_format: str,
+        options: VideoConversionOptions,
+        media: Optional[Dict] = None
+    ) -> str:
+        """Convert video using FFmpeg command line and return the output file path."""
+        # Create temporary output file; the input is already on disk and the
+        # caller owns (and removes) the output once it has been sent
+        fd, output_path = tempfile.mkstemp(suffix=f'.{target_format}')
+        os.close(fd)
+
+        nvenc_device = None
         try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
+            output_args = [output_path]
+            if options.faststart:
+                output_args = [*FILE_MUXER_ARGS.get(target_format, []), output_path]
+            ffmpeg_cmd, nvenc_device = await self._build_ffmpeg_command(
+                input_path, target_format, options, output_args, media
+            )
+
+            # Run FFmpeg
+            returncode, _, stderr = await self._run_process(ffmpeg_cmd, timeout=300)
+
+            if returncode != 0 and nvenc_device is not None:
+                # NVDEC can't decode every source (e.g. 4:2:2 or some 10-bit inputs); redo it in software
+                logger.warning("NVENC conversion failed, retrying in software", error=stderr.decode(errors='replace'))
+                self._nvenc_sessions[nvenc_device].release()
+                nvenc_device = None
+                ffmpeg_cmd, _ = await self._build_ffmpeg_command(
+                    input_path, target_format, options.model_copy(update={'hw_accel': 'none'}), output_args, media
                 )
-
-            # Convert using FFmpeg
-            flv_content = self._convert_with_ffmpeg(file_buffer, 'flv', options)
-
-            logger.info("MKV to FLV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="MKV converted to FLV successfully",
-                data=flv_content,
-                format="flv",
-                file_size=len(flv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("MKV to FLV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting MKV to FLV",
-                error=str(e)
-            )
-
-    # WEBM conversions
-    async def convert_webm_to_mp4(
+                returncode, _, stderr = await self._run_process(ffmpeg_cmd, timeout=300)
+            
+            if returncode != 0:
+                raise Exception(f"FFmpeg error: {stderr.decode(errors='replace')}")
+            
+            return output_path
+            
+        except asyncio.TimeoutError:
+            os.unlink(output_path)
+            raise Exception("Video conversion timed out (5 minutes limit)")
+        except BaseException:
+            os.unlink(output_path)
+            raise
+        finally:
+            if nvenc_device is not None:
+                self._nvenc_sessions[nvenc_device].release()
+
+    async def convert_ladder(
         self,
-        file_buffer: bytes,
+        target_format: str,
+        input_path: str,
+        resolutions: List[str],
         options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert WEBM to MP4."""
+    ) -> Dict[str, str]:
+        """Encode one input at several resolutions with a single ffmpeg process.
+
+        The input is decoded once and fanned out to one output per resolution,
+        instead of repeating the decode for every rung of the ladder. Rungs are
+        encoded in software so one job doesn't take several NVENC sessions.
+        Returns the output path for each resolution; the caller owns the files.
+        Failures raise ConversionError.
+        """
+        if options is None:
+            options = self._DEFAULT_OPTIONS
+
+        is_valid, message = self._validate_file_limits(input_path, options)
+        if not is_valid:
+            raise ConversionError(400, message)
+
+        media = await self._probe_media(input_path)
+        is_valid, message = self._validate_duration(media, options)
+        if not is_valid:
+            raise ConversionError(400, message)
+
+        output_paths = {}
+        ffmpeg_cmd = [FFMPEG_BINARY, '-y', '-loglevel', 'error', '-i', input_path]
         try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
+            for resolution in resolutions:
+                fd, output_path = tempfile.mkstemp(suffix=f'.{target_format}')
+                os.close(fd)
+                output_paths[resolution] = output_path
+
+                # Output options apply to the next output file only
+                rung_options = options.model_copy(update={'resolution': resolution})
+                ffmpeg_cmd.extend(self._get_ffmpeg_params(target_format, rung_options))
+                if options.faststart:
+                    ffmpeg_cmd.extend(FILE_MUXER_ARGS.get(target_format, []))
+                ffmpeg_cmd.append(output_path)
+
+            returncode, _, stderr = await self._run_process(ffmpeg_cmd, timeout=300)
+            if returncode != 0:
+                logger.error(
+                    "ladder_conversion_failed",
+                    component=LOG_COMPONENT, dst=target_format, error=stderr.decode(errors='replace')
                 )
+                raise ConversionError(500, f"Error converting to {target_format.upper()}")
 
-            # Convert using FFmpeg
-            mp4_content = self._convert_with_ffmpeg(file_buffer, 'mp4', options)
-
-            logger.info("WEBM to MP4 conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="WEBM converted to MP4 successfully",
-                data=mp4_content,
-                format="mp4",
-                file_size=len(mp4_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
+            return output_paths
 
-        except Exception as e:
-            logger.error("WEBM to MP4 conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting WEBM to MP4",
-                error=str(e)
-            )
+        except BaseException as e:
+            for output_path in output_paths.values():
+                os.unlink(output_path)
+            if isinstance(e, asyncio.TimeoutError):
+                raise ConversionError(500, "Video conversion timed out (5 minutes limit)") from e
+            if isinstance(e, ValueError):
+                raise ConversionError(400, str(e)) from e
+            raise
 
-    async def convert_webm_to_avi(
+    async def convert_stream(
         self,
-        file_buffer: bytes,
+        source_format: str,
+        target_format: str,
+        input_path: str,
         options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert WEBM to AVI."""
+    ) -> AsyncIterator[bytes]:
+        """Convert a video and yield the output while ffmpeg is still encoding.
+
+        Only targets in STREAMING_MUXER_ARGS can be streamed. Failures raise
+        ConversionError; callers should read the first chunk before committing
+        to a response so early failures still map to an error status.
+        """
+        if options is None:
+            options = self._DEFAULT_OPTIONS
+
+        is_valid, message = self._validate_file_limits(input_path, options)
+        if not is_valid:
+            raise ConversionError(400, message)
+
+        media = await self._probe_media(input_path)
+        is_valid, message = self._validate_duration(media, options)
+        if not is_valid:
+            raise ConversionError(400, message)
+
+        output_args = [*STREAMING_MUXER_ARGS[target_format], 'pipe:1']
+        ffmpeg_cmd, nvenc_device = await self._build_ffmpeg_command(
+            input_path, target_format, options, output_args, media
+        )
         try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
+            process = await asyncio.create_subprocess_exec(
+                *FFMPEG_LAUNCH_PREFIX, *ffmpeg_cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True
+            )
+            streamed = False
+            try:
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + 300
+                while chunk := await asyncio.wait_for(
+                    process.stdout.read(STREAM_CHUNK_SIZE), timeout=deadline - loop.time()
+                ):
+                    streamed = True
+                    yield chunk
+
+                stderr = await asyncio.wait_for(process.stderr.read(), timeout=deadline - loop.time())
+                await asyncio.wait_for(process.wait(), timeout=deadline - loop.time())
+            finally:
+                # Client went away, timed out or failed: don't leave ffmpeg running
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+
+            if process.returncode != 0 and nvenc_device is not None and not streamed:
+                # Nothing reached the client yet, so an NVDEC decode failure can still be redone in software
+                logger.warning("NVENC conversion failed, retrying in software", error=stderr.decode(errors='replace'))
+                self._nvenc_sessions[nvenc_device].release()
+                nvenc_device = None
+                software_options = options.model_copy(update={'hw_accel': 'none'})
+                async for chunk in self.convert_stream(source_format, target_format, input_path, software_options):
+                    yield chunk
+                return
+
+            if process.returncode != 0:
+                logger.error(
+                    "streaming_conversion_failed", component=LOG_COMPONENT,
+                    src=source_format, dst=target_format, error=stderr.decode(errors='replace')
                 )
-
-            # Convert using FFmpeg
-            avi_content = self._convert_with_ffmpeg(file_buffer, 'avi', options)
-
-            logger.info("WEBM to AVI conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="WEBM converted to AVI successfully",
-                data=avi_content,
-                format="avi",
-                file_size=len(avi_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("WEBM to AVI conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting WEBM to AVI",
-                error=str(e)
-            )
-
-    async def convert_webm_to_mov(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
+                raise ConversionError(500, f"Error converting {source_format.upper()} to {target_format.upper()}")
+        finally:
+            if nvenc_device is not None:
+                self._nvenc_sessions[nvenc_device].release()
+
+    @staticmethod
+    def _ok_response(
+        source_label: str,
+        target_label: str,
+        target_format: str,
+        output_path: str,
+        options: VideoConversionOptions
     ) -> VideoServiceResponse:
-        """Convert WEBM to MOV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            mov_content = self._convert_with_ffmpeg(file_buffer, 'mov', options)
-
-            logger.info("WEBM to MOV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="WEBM converted to MOV successfully",
-                data=mov_content,
-                format="mov",
-                file_size=len(mov_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("WEBM to MOV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting WEBM to MOV",
-                error=str(e)
-            )
-
-    async def convert_webm_to_mkv(
+        """Build the success response for a finished conversion."""
+        return VideoServiceResponse(
+            status=200,
+            message=f"{source_label} converted to {target_label} successfully",
+            output_path=output_path,
+            format=target_format,
+            file_size=os.path.getsize(output_path),
+            resolution=options.resolution,
+            bitrate=options.bitrate,
+            fps=options.fps
+        )
+
+    @staticmethod
+    def _err_response(status: int, message: str, error: str) -> VideoServiceResponse:
+        """Build a failure response."""
+        return VideoServiceResponse(status=status, message=message, error=error)
+
+    async def convert(
         self,
-        file_buffer: bytes,
+        source_format: str,
+        target_format: str,
+        input_path: str,
         options: Optional[VideoConversionOptions] = None
     ) -> VideoServiceResponse:
-        """Convert WEBM to MKV."""
+        """Convert a video file from one container format to another."""
+        source_label = source_format.upper()
+        target_label = target_format.upper()
         try:
             if options is None:
-                options = VideoConversionOptions()
+                options = self._DEFAULT_OPTIONS
 
             # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
+            is_valid, message = self._validate_file_limits(input_path, options)
             if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            mkv_content = self._convert_with_ffmpeg(file_buffer, 'mkv', options)
-
-            logger.info("WEBM to MKV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="WEBM converted to MKV successfully",
-                data=mkv_content,
-                format="mkv",
-                file_size=len(mkv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
-
-        except Exception as e:
-            logger.error("WEBM to MKV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting WEBM to MKV",
-                error=str(e)
-            )
+                return self._err_response(400, message, "File validation failed")
 
-    async def convert_webm_to_wmv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert WEBM to WMV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
+            # One ffprobe pass serves both the duration limit and the remux decision
+            media = await self._probe_media(input_path)
+            is_valid, message = self._validate_duration(media, options)
             if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
+                return self._err_response(400, message, "File validation failed")
 
             # Convert using FFmpeg
-            wmv_content = self._convert_with_ffmpeg(file_buffer, 'wmv', options)
-
-            logger.info("WEBM to WMV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="WEBM converted to WMV successfully",
-                data=wmv_content,
-                format="wmv",
-                file_size=len(wmv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
-            )
+            output_path = await self._convert_with_ffmpeg(input_path, target_format, options, media)
 
-        except Exception as e:
-            logger.error("WEBM to WMV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting WEBM to WMV",
-                error=str(e)
-            )
-
-    async def convert_webm_to_flv(
-        self,
-        file_buffer: bytes,
-        options: Optional[VideoConversionOptions] = None
-    ) -> VideoServiceResponse:
-        """Convert WEBM to FLV."""
-        try:
-            if options is None:
-                options = VideoConversionOptions()
-
-            # Validate file limits
-            is_valid, message = self._validate_file_limits(file_buffer, options)
-            if not is_valid:
-                return VideoServiceResponse(
-                    status=400,
-                    message=message,
-                    error="File validation failed"
-                )
-
-            # Convert using FFmpeg
-            flv_content = self._convert_with_ffmpeg(file_buffer, 'flv', options)
-
-            logger.info("WEBM to FLV conversion completed")
-            return VideoServiceResponse(
-                status=200,
-                message="WEBM converted to FLV successfully",
-                data=flv_content,
-                format="flv",
-                file_size=len(flv_content),
-                resolution=options.resolution,
-                bitrate=options.bitrate,
-                fps=options.fps
+            response = self._ok_response(source_label, target_label, target_format, output_path, options)
+            logger.info(
+                "conversion_completed",
+                component=LOG_COMPONENT, src=source_format, dst=target_format, size=response.file_size
             )
+            return response
 
         except Exception as e:
-            logger.error("WEBM to FLV conversion failed", error=str(e))
-            return VideoServiceResponse(
-                status=500,
-                message="Error converting WEBM to FLV",
-                error=str(e)
+            logger.error(
+                "conversion_failed", component=LOG_COMPONENT, src=source_format, dst=target_format, error=str(e)
             )
+            return self._err_response(500, f"Error converting {source_label} to {target_label}", str(e))
 
     async def get_supported_conversions(self):
         """Get list of supported video conversions."""
@@ -1453,5 +848,15 @@ class VideoConverterService:
         }
 
 
+# Per-pair entry points, e.g. convert_mp4_to_avi(input_path, options)
+for _source_format in ('mp4', 'avi', 'mov', 'mkv', 'webm'):
+    for _target_format in ('mp4', 'avi', 'mov', 'mkv', 'webm', 'wmv', 'flv'):
+        if _source_format != _target_format:
+            setattr(
+                VideoConverterService,
+                f'convert_{_source_format}_to_{_target_format}',
+                functools.partialmethod(VideoConverterService.convert, _source_format, _target_format)
+            )
+
 # Global instance
 video_converter_service = VideoConverterService()
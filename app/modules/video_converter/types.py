@@ -2,18 +2,32 @@
 Video converter types.
 """
 
-from pydantic import BaseModel, validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal, Optional
+
+
+# Values accepted by the conversion endpoints
+VideoCodec = Literal["h264", "hevc", "vp9", "av1"]
+VideoResolution = Literal["3840x2160", "1920x1080", "1280x720", "854x480", "640x360"]
+VideoHwAccel = Literal["auto", "nvenc", "vaapi", "qsv", "none"]
+VideoPreset = Literal["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow"]
 
 
 class VideoConversionOptions(BaseModel):
     """Options for video format conversions."""
     
+    model_config = ConfigDict(frozen=True)
+    
     # Video quality settings
-    quality: str = "medium"  # low, medium, high, ultra
-    resolution: str = "720p"  # 480p, 720p, 1080p, 4k
+    quality: str = "medium"  # low, medium, high, ultra; picks the encoder preset
+    resolution: Optional[str] = None  # Bounding box (WIDTHxHEIGHT, 480p, 720p, 1080p, 4k); None keeps the source size
     bitrate: str = "1000k"  # Video bitrate (e.g., "500k", "1000k", "2000k")
     fps: int = 30  # Frames per second
+    codec: Optional[str] = None  # Preferred video codec (h264, hevc, vp9, av1); None keeps the container default
+    hw_accel: str = "auto"  # auto (first working of NVENC, VAAPI, QSV), nvenc, vaapi, qsv, none
+    preset: Optional[str] = None  # x264/x265 speed preset (ultrafast ... slow); None derives it from quality
+    allow_remux: bool = False  # Copy streams instead of re-encoding when the target container supports them
+    faststart: bool = True  # Move the MP4/MOV index to the front of file outputs so playback starts early
     
     # Audio settings
     audio_bitrate: str = "128k"  # Audio bitrate
@@ -22,36 +36,12 @@ class VideoConversionOptions(BaseModel):
     # Processing options
     trim_start: float = 0.0  # Start trimming at this time (seconds)
     trim_end: Optional[float] = None  # End trimming at this time (seconds)
-    speed: float = 1.0  # Playback speed (0.5x to 2.0x)
-    volume: float = 1.0  # Volume multiplier (0.1 to 2.0)
-    
-    # Security limits
-    max_duration: int = 300  # Maximum duration in seconds (5 minutes)
-    max_file_size: int = 100 * 1024 * 1024  # Maximum file size (100MB)
-    
-    @validator('max_duration')
-    def validate_max_duration(cls, v):
-        if v > 600:  # 10 minutes absolute maximum
-            raise ValueError("Maximum duration cannot exceed 10 minutes (600 seconds)")
-        return v
-    
-    @validator('max_file_size')
-    def validate_max_file_size(cls, v):
-        if v > 500 * 1024 * 1024:  # 500MB absolute maximum
-            raise ValueError("Maximum file size cannot exceed 500MB")
-        return v
-    
-    @validator('speed')
-    def validate_speed(cls, v):
-        if not 0.25 <= v <= 4.0:
-            raise ValueError("Speed must be between 0.25x and 4.0x")
-        return v
+    speed: float = Field(1.0, ge=0.25, le=4.0)  # Playback speed (0.25x to 4.0x)
+    volume: float = Field(1.0, ge=0.1, le=2.0)  # Volume multiplier (0.1 to 2.0)
     
-    @validator('volume')
-    def validate_volume(cls, v):
-        if not 0.1 <= v <= 2.0:
-            raise ValueError("Volume must be between 0.1 and 2.0")
-        return v
+    # Security limits, bounded by the absolute maximums (10 minutes, 500MB)
+    max_duration: int = Field(300, le=600)  # Maximum duration in seconds (5 minutes)
+    max_file_size: int = Field(100 * 1024 * 1024, le=500 * 1024 * 1024)  # Maximum file size (100MB)
 
 
 class VideoServiceResponse(BaseModel):
@@ -59,7 +49,7 @@ class VideoServiceResponse(BaseModel):
     
     status: int
     message: str
-    data: Optional[bytes] = None
+    output_path: Optional[str] = None  # Converted file on disk, removed once streamed
     format: Optional[str] = None
     duration: Optional[float] = None  # Video duration in seconds
     file_size: Optional[int] = None  # File size in bytes
@@ -2,8 +2,12 @@
 Web converter controller.
 """
 
+import inspect
+import os
+from typing import Awaitable, Callable, Tuple
+
 from fastapi import HTTPException, UploadFile, File, Form, status
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 import structlog
 
 from .service import web_converter_service
@@ -11,602 +15,123 @@ from .types import WebConversionOptions
 
 logger = structlog.get_logger(__name__)
 
-# HTML conversions
-async def convert_html_to_xml(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    pretty_print: bool = Form(True)
-) -> Response:
-    """Convert HTML file to XML."""
-    try:
-        if not file.filename.lower().endswith('.html'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .html files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            pretty_print=pretty_print
-        )
-
-        result = await web_converter_service.convert_html_to_xml(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.xml'
-        return Response(
-            content=result.data,
-            media_type="application/xml",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_html_to_xml controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_html_to_json(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    pretty_print: bool = Form(True)
-) -> Response:
-    """Convert HTML file to JSON."""
-    try:
-        if not file.filename.lower().endswith('.html'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .html files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            pretty_print=pretty_print
-        )
-
-        result = await web_converter_service.convert_html_to_json(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.json'
-        return Response(
-            content=result.data,
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_html_to_json controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-# XML conversions
-async def convert_xml_to_html(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8")
-) -> Response:
-    """Convert XML file to HTML."""
-    try:
-        if not file.filename.lower().endswith('.xml'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .xml files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(encoding=encoding)
-
-        result = await web_converter_service.convert_xml_to_html(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.html'
-        return Response(
-            content=result.data,
-            media_type="text/html",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_xml_to_html controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_xml_to_json(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    pretty_print: bool = Form(True)
-) -> Response:
-    """Convert XML file to JSON."""
-    try:
-        if not file.filename.lower().endswith('.xml'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .xml files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            pretty_print=pretty_print
-        )
-
-        result = await web_converter_service.convert_xml_to_json(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.json'
-        return Response(
-            content=result.data,
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_xml_to_json controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_xml_to_txt(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8")
-) -> Response:
-    """Convert XML file to TXT."""
-    try:
-        if not file.filename.lower().endswith('.xml'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .xml files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(encoding=encoding)
-
-        result = await web_converter_service.convert_xml_to_txt(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.txt'
-        return Response(
-            content=result.data,
-            media_type="text/plain",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_xml_to_txt controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_xml_to_csv(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    delimiter: str = Form(","),
-    include_headers: bool = Form(True)
-) -> Response:
-    """Convert XML file to CSV."""
-    try:
-        if not file.filename.lower().endswith('.xml'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .xml files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            delimiter=delimiter,
-            include_headers=include_headers
-        )
-
-        result = await web_converter_service.convert_xml_to_csv(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.csv'
-        return Response(
-            content=result.data,
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_xml_to_csv controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-# JSON conversions
-async def convert_json_to_html(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8")
-) -> Response:
-    """Convert JSON file to HTML."""
-    try:
-        if not file.filename.lower().endswith('.json'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .json files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(encoding=encoding)
-
-        result = await web_converter_service.convert_json_to_html(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.html'
-        return Response(
-            content=result.data,
-            media_type="text/html",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_json_to_html controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_json_to_xml(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8")
-) -> Response:
-    """Convert JSON file to XML."""
-    try:
-        if not file.filename.lower().endswith('.json'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .json files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(encoding=encoding)
-
-        result = await web_converter_service.convert_json_to_xml(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.xml'
-        return Response(
-            content=result.data,
-            media_type="application/xml",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_json_to_xml controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_json_to_txt(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8")
-) -> Response:
-    """Convert JSON file to TXT."""
-    try:
-        if not file.filename.lower().endswith('.json'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .json files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(encoding=encoding)
-
-        result = await web_converter_service.convert_json_to_txt(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.txt'
-        return Response(
-            content=result.data,
-            media_type="text/plain",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_json_to_txt controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_json_to_csv(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    delimiter: str = Form(","),
-    include_headers: bool = Form(True)
-) -> Response:
-    """Convert JSON file to CSV."""
-    try:
-        if not file.filename.lower().endswith('.json'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .json files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            delimiter=delimiter,
-            include_headers=include_headers
-        )
-
-        result = await web_converter_service.convert_json_to_csv(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.csv'
-        return Response(
-            content=result.data,
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_json_to_csv controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-# CSV conversions
-async def convert_csv_to_html(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    delimiter: str = Form(","),
-    include_headers: bool = Form(True)
-) -> Response:
-    """Convert CSV file to HTML."""
-    try:
-        if not file.filename.lower().endswith('.csv'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .csv files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            delimiter=delimiter,
-            include_headers=include_headers
-        )
-
-        result = await web_converter_service.convert_csv_to_html(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.html'
-        return Response(
-            content=result.data,
-            media_type="text/html",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_csv_to_html controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_csv_to_xml(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    delimiter: str = Form(",")
-) -> Response:
-    """Convert CSV file to XML."""
-    try:
-        if not file.filename.lower().endswith('.csv'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .csv files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            delimiter=delimiter
-        )
-
-        result = await web_converter_service.convert_csv_to_xml(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.xml'
-        return Response(
-            content=result.data,
-            media_type="application/xml",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_csv_to_xml controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_csv_to_json(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    delimiter: str = Form(","),
-    pretty_print: bool = Form(True)
-) -> Response:
-    """Convert CSV file to JSON."""
-    try:
-        if not file.filename.lower().endswith('.csv'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .csv files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            delimiter=delimiter,
-            pretty_print=pretty_print
-        )
-
-        result = await web_converter_service.convert_csv_to_json(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.json'
-        return Response(
-            content=result.data,
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_csv_to_json controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def convert_csv_to_txt(
-    file: UploadFile = File(...),
-    encoding: str = Form("utf-8"),
-    delimiter: str = Form(","),
-    include_headers: bool = Form(True)
-) -> Response:
-    """Convert CSV file to TXT."""
-    try:
-        if not file.filename.lower().endswith('.csv'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only .csv files are supported"
-            )
-
-        file_content = await file.read()
-        options = WebConversionOptions(
-            encoding=encoding,
-            delimiter=delimiter,
-            include_headers=include_headers
-        )
-
-        result = await web_converter_service.convert_csv_to_txt(file_content, options)
-
-        if result.status != 200:
-            raise HTTPException(
-                status_code=result.status,
-                detail=result.message
-            )
-
-        filename = file.filename.rsplit('.', 1)[0] + '.txt'
-        return Response(
-            content=result.data,
-            media_type="text/plain",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error in convert_csv_to_txt controller", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error converting file: {str(e)}"
-        )
-
-async def get_supported_conversions():
+# Response content type for each target format
+WEB_MEDIA_TYPES = {
+    "html": "text/html",
+    "xml": "application/xml",
+    "json": "application/json",
+    "txt": "text/plain",
+    "csv": "text/csv",
+}
+
+# Accepted upload extensions and declared content types for each source format;
+# either one is enough, so uploads with an unusual name but the right type get through
+SOURCE_SUFFIXES = {
+    "html": frozenset({".html", ".htm"}),
+    "xml": frozenset({".xml"}),
+    "json": frozenset({".json"}),
+    "csv": frozenset({".csv"}),
+}
+SOURCE_CONTENT_TYPES = {
+    "html": frozenset({"text/html"}),
+    "xml": frozenset({"application/xml", "text/xml"}),
+    "json": frozenset({"application/json"}),
+    "csv": frozenset({"text/csv", "application/csv"}),
+}
+
+# Sources the service parses straight from the upload file; the rest need the whole buffer
+STREAMED_SOURCES = frozenset({"xml", "csv"})
+
+# Optional form fields, each mapping onto the WebConversionOptions field of the same name
+OPTION_FORM_FIELDS = {
+    "pretty_print": (bool, True),
+    "delimiter": (str, ","),
+    "include_headers": (bool, True),
+}
+
+# Exposed conversions and the optional form fields each one accepts
+WEB_CONVERSIONS = [
+    ("html", "xml", ("pretty_print",)),
+    ("html", "json", ("pretty_print",)),
+    ("xml", "html", ()),
+    ("xml", "json", ("pretty_print",)),
+    ("xml", "txt", ()),
+    ("xml", "csv", ("delimiter", "include_headers")),
+    ("json", "html", ()),
+    ("json", "xml", ()),
+    ("json", "txt", ()),
+    ("json", "csv", ("delimiter", "include_headers")),
+    ("csv", "html", ("delimiter", "include_headers")),
+    ("csv", "xml", ("delimiter",)),
+    ("csv", "json", ("delimiter", "pretty_print")),
+    ("csv", "txt", ("delimiter", "include_headers")),
+]
+
+
+def endpoint(
+    source_format: str,
+    target_format: str,
+    form_fields: Tuple[str, ...]
+) -> Callable[..., Awaitable[Response]]:
+    """Build the FastAPI endpoint for one (source, target) conversion."""
+    media_type = WEB_MEDIA_TYPES[target_format]
+    service_fn = getattr(web_converter_service, f"convert_{source_format}_to_{target_format}")
+    handler_name = f"convert_{source_format}_to_{target_format}"
+    suffixes = SOURCE_SUFFIXES[source_format]
+    content_types = SOURCE_CONTENT_TYPES[source_format]
+
+    async def convert_web(file: UploadFile, encoding: str, **form) -> Response:
+        try:
+            stem, extension = os.path.splitext(file.filename or "")
+            if extension.lower() not in suffixes and file.content_type not in content_types:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Only .{source_format} files are supported"
+                )
+
+            options = WebConversionOptions(encoding=encoding, **form)
+
+            source = file.file if source_format in STREAMED_SOURCES else await file.read()
+            result = await service_fn(source, options)
+
+            if result.status != 200:
+                raise HTTPException(
+                    status_code=result.status,
+                    detail=result.message
+                )
+
+            filename = f"{stem or 'converted'}.{target_format}"
+            return Response(
+                content=result.data,
+                media_type=media_type,
+                headers={"Content-Disposition": f"attachment; filename={filename}"}
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("convert_failed", src=source_format, dst=target_format, error=str(e))
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error converting file: {str(e)}"
+            )
+
+    # FastAPI reads the form fields from the signature, so expose only this conversion's fields
+    parameters = [
+        inspect.Parameter("file", inspect.Parameter.KEYWORD_ONLY, default=File(...), annotation=UploadFile),
+        inspect.Parameter("encoding", inspect.Parameter.KEYWORD_ONLY, default=Form("utf-8"), annotation=str),
+    ]
+    for name in form_fields:
+        annotation, default = OPTION_FORM_FIELDS[name]
+        parameters.append(
+            inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=Form(default), annotation=annotation)
+        )
+    convert_web.__signature__ = inspect.Signature(parameters, return_annotation=Response)
+    convert_web.__name__ = handler_name
+    convert_web.__doc__ = f"Convert {source_format.upper()} file to {target_format.upper()}."
+    return convert_web
+
+
+async def get_supported_conversions() -> ORJSONResponse:
     """Get list of supported web conversions."""
-    return await web_converter_service.get_supported_conversions()
+    return ORJSONResponse(await web_converter_service.get_supported_conversions())
@@ -8,135 +8,21 @@ from . import controller
 
 router = APIRouter()
 
-# HTML conversions
-router.add_api_route(
-    "/html-to-xml",
-    controller.convert_html_to_xml,
-    methods=["POST"],
-    summary="Convert HTML to XML",
-    description="Upload an HTML file and convert it to XML format",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/html-to-json",
-    controller.convert_html_to_json,
-    methods=["POST"],
-    summary="Convert HTML to JSON",
-    description="Upload an HTML file and convert it to JSON format",
-    tags=["Web Conversion"]
-)
-
-# XML conversions
-router.add_api_route(
-    "/xml-to-html",
-    controller.convert_xml_to_html,
-    methods=["POST"],
-    summary="Convert XML to HTML",
-    description="Upload an XML file and convert it to HTML format",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/xml-to-json",
-    controller.convert_xml_to_json,
-    methods=["POST"],
-    summary="Convert XML to JSON",
-    description="Upload an XML file and convert it to JSON format",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/xml-to-txt",
-    controller.convert_xml_to_txt,
-    methods=["POST"],
-    summary="Convert XML to TXT",
-    description="Upload an XML file and convert it to plain text",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/xml-to-csv",
-    controller.convert_xml_to_csv,
-    methods=["POST"],
-    summary="Convert XML to CSV",
-    description="Upload an XML file and convert it to CSV format",
-    tags=["Web Conversion"]
-)
-
-# JSON conversions
-router.add_api_route(
-    "/json-to-html",
-    controller.convert_json_to_html,
-    methods=["POST"],
-    summary="Convert JSON to HTML",
-    description="Upload a JSON file and convert it to HTML format",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/json-to-xml",
-    controller.convert_json_to_xml,
-    methods=["POST"],
-    summary="Convert JSON to XML",
-    description="Upload a JSON file and convert it to XML format",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/json-to-txt",
-    controller.convert_json_to_txt,
-    methods=["POST"],
-    summary="Convert JSON to TXT",
-    description="Upload a JSON file and convert it to plain text",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/json-to-csv",
-    controller.convert_json_to_csv,
-    methods=["POST"],
-    summary="Convert JSON to CSV",
-    description="Upload a JSON file and convert it to CSV format",
-    tags=["Web Conversion"]
-)
-
-# CSV conversions
-router.add_api_route(
-    "/csv-to-html",
-    controller.convert_csv_to_html,
-    methods=["POST"],
-    summary="Convert CSV to HTML",
-    description="Upload a CSV file and convert it to HTML format",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/csv-to-xml",
-    controller.convert_csv_to_xml,
-    methods=["POST"],
-    summary="Convert CSV to XML",
-    description="Upload a CSV file and convert it to XML format",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/csv-to-json",
-    controller.convert_csv_to_json,
-    methods=["POST"],
-    summary="Convert CSV to JSON",
-    description="Upload a CSV file and convert it to JSON format",
-    tags=["Web Conversion"]
-)
-
-router.add_api_route(
-    "/csv-to-txt",
-    controller.convert_csv_to_txt,
-    methods=["POST"],
-    summary="Convert CSV to TXT",
-    description="Upload a CSV file and convert it to plain text",
-    tags=["Web Conversion"]
-)
+# Shared by every route below
+WEB_TAGS = ["Web Conversion"]
+
+# Conversion endpoints, e.g. /html-to-xml
+for source_format, target_format, form_fields in controller.WEB_CONVERSIONS:
+    article = "a" if source_format in ("json", "csv") else "an"
+    target_label = "plain text" if target_format == "txt" else f"{target_format.upper()} format"
+    router.add_api_route(
+        f"/{source_format}-to-{target_format}",
+        controller.endpoint(source_format, target_format, form_fields),
+        methods=["POST"],
+        summary=f"Convert {source_format.upper()} to {target_format.upper()}",
+        description=f"Upload {article} {source_format.upper()} file and convert it to {target_label}",
+        tags=WEB_TAGS
+    )
 
 # Get supported conversions
 router.add_api_route(
@@ -145,5 +31,5 @@ router.add_api_route(
     methods=["GET"],
     summary="Get supported web conversions",
     description="Get list of all supported web format conversions",
-    tags=["Web Conversion"]
+    tags=WEB_TAGS
 )
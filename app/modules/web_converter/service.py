@@ -3,18 +3,56 @@ Web conversion service.
 Handles HTML, XML, JSON, CSV conversions.
 """
 
+import codecs
+import functools
 import io
 import json
 import csv
-import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 from bs4 import BeautifulSoup
+from lxml import etree
+import orjson
 import structlog
 
 from .types import WebServiceResponse, WebConversionOptions
 
 logger = structlog.get_logger(__name__)
 
+# IANA names libxml2 knows for Python codecs whose canonical name it doesn't accept;
+# other canonical names only need underscores turned into hyphens
+LIBXML2_ENCODING_NAMES = {
+    'utf-16-le': 'UTF-16LE',
+    'utf-16-be': 'UTF-16BE',
+    'utf-32-le': 'UTF-32LE',
+    'utf-32-be': 'UTF-32BE',
+    'mac-roman': 'macintosh',
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _xml_parser(encoding: Optional[str]) -> etree.XMLParser:
+    """Reusable libxml2 parser for one input encoding, given by its libxml2 name.
+
+    None parses text that has already been decoded.
+
+    Entities declared in the document itself are expanded as the
+    standard-library parser did, while external DTDs, external entities and
+    network access stay off so uploads can't pull in other files. Comments
+    and processing instructions are dropped, also as before. Parsing only
+    happens on the event loop thread, so a parser is never used by two
+    threads at once.
+    """
+    return etree.XMLParser(
+        encoding=encoding,
+        huge_tree=False,
+        collect_ids=False,
+        resolve_entities='internal',
+        load_dtd=False,
+        no_network=True,
+        remove_comments=True,
+        remove_pis=True,
+    )
+
 
 class WebConverterService:
     """Service for converting web formats."""
@@ -39,6 +77,57 @@ class WebConverterService:
         source_format = source_format.lower().replace('.', '')
         return self.supported_conversions.get(source_format, [])
 
+    def _as_binary(self, source: Union[bytes, BinaryIO]) -> BinaryIO:
+        """Wrap an in-memory buffer so it reads like an uploaded file."""
+        return io.BytesIO(source) if isinstance(source, bytes) else source
+
+    def _read_csv(self, source: Union[bytes, BinaryIO], options: WebConversionOptions, reader=csv.DictReader) -> list:
+        """Parse CSV rows from an upload, decoding it as it is read rather than all at once."""
+        stream = io.TextIOWrapper(self._as_binary(source), encoding=options.encoding, newline='')
+        try:
+            return list(reader(
+                stream,
+                delimiter=options.delimiter,
+                quotechar=options.quote_char,
+                escapechar=options.escape_char
+            ))
+        finally:
+            # Hand the upload back to its owner instead of closing it with the wrapper
+            stream.detach()
+
+    def _parse_xml(self, source: Union[bytes, BinaryIO], options: WebConversionOptions) -> etree._Element:
+        """Parse an XML upload with libxml2, feeding it to the parser in chunks."""
+        codec = codecs.lookup(options.encoding).name
+        try:
+            parser = _xml_parser(LIBXML2_ENCODING_NAMES.get(codec, codec.replace('_', '-')))
+            root = etree.parse(self._as_binary(source), parser=parser).getroot()
+        except LookupError:
+            # libxml2 can't decode this codec (e.g. cp437), so decode it in Python as it is read
+            stream = io.TextIOWrapper(self._as_binary(source), encoding=codec)
+            try:
+                root = etree.parse(stream, parser=_xml_parser(None)).getroot()
+            finally:
+                # Hand the upload back to its owner instead of closing it with the wrapper
+                stream.detach()
+
+        # Only external entities are left unexpanded; reject them like the standard-library parser did
+        if next(root.iter(etree.Entity), None) is not None:
+            raise ValueError("External entities are not supported")
+
+        return root
+
+    def _dump_json(self, data, options: WebConversionOptions) -> bytes:
+        """Serialize converted data to JSON in the requested encoding."""
+        # DictReader files surplus fields under a None key, so non-string keys must be allowed
+        flags = orjson.OPT_NON_STR_KEYS
+        if options.pretty_print:
+            flags |= orjson.OPT_INDENT_2
+        json_bytes = orjson.dumps(data, option=flags)
+        # orjson always emits UTF-8
+        if codecs.lookup(options.encoding).name != 'utf-8':
+            return json_bytes.decode('utf-8').encode(options.encoding)
+        return json_bytes
+
     # HTML conversions
     async def convert_html_to_xml(
         self,
@@ -118,13 +207,14 @@ class WebConverterService:
             
             json_data["body"]["content"] = body_content
 
-            json_str = json.dumps(json_data, indent=2 if options.pretty_print else None)
             
+            json_bytes = self._dump_json(json_data, options)
+
             logger.info("HTML to JSON conversion completed")
             return WebServiceResponse(
                 status=200,
                 message="HTML converted to JSON successfully",
-                data=json_str.encode(options.encoding),
+                data=json_bytes,
                 format="json"
             )
 
@@ -139,7 +229,7 @@ class WebConverterService:
     # XML conversions
     async def convert_xml_to_html(
         self,
-        file_buffer: bytes,
+        source: Union[bytes, BinaryIO],
         options: Optional[WebConversionOptions] = None
     ) -> WebServiceResponse:
         """Convert XML to HTML."""
@@ -147,8 +237,7 @@ class WebConverterService:
             if options is None:
                 options = WebConversionOptions()
 
-            xml_content = file_buffer.decode(options.encoding)
-            root = ET.fromstring(xml_content)
+            root = self._parse_xml(source, options)
             
             # Convert XML to HTML
             html_content = f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="{options.encoding}">\n</head>\n<body>\n'
@@ -158,6 +247,8 @@ class WebConverterService:
                 if element.text and element.text.strip():
                     html += element.text.strip()
                 for child in element:
+                    if not isinstance(child.tag, str):
+                        continue
                     html += "\n" + xml_to_html(child, indent + "  ")
                 if element.tail:
                     html += element.tail
@@ -185,7 +276,7 @@ class WebConverterService:
 
     async def convert_xml_to_json(
         self,
-        file_buffer: bytes,
+        source: Union[bytes, BinaryIO],
         options: Optional[WebConversionOptions] = None
     ) -> WebServiceResponse:
         """Convert XML to JSON."""
@@ -193,8 +284,7 @@ class WebConverterService:
             if options is None:
                 options = WebConversionOptions()
 
-            xml_content = file_buffer.decode(options.encoding)
-            root = ET.fromstring(xml_content)
+            root = self._parse_xml(source, options)
             
             def xml_to_dict(element):
                 result = {}
@@ -202,10 +292,12 @@ class WebConverterService:
                     result['text'] = element.text.strip()
                 
                 if element.attrib:
-                    result['attributes'] = element.attrib
+                    result['attributes'] = dict(element.attrib)
                 
                 children = {}
                 for child in element:
+                    if not isinstance(child.tag, str):
+                        continue
                     if child.tag in children:
                         if not isinstance(children[child.tag], list):
                             children[child.tag] = [children[child.tag]]
@@ -219,13 +311,14 @@ class WebConverterService:
                 return result
 
             json_data = {root.tag: xml_to_dict(root)}
-            json_str = json.dumps(json_data, indent=2 if options.pretty_print else None)
             
+            json_bytes = self._dump_json(json_data, options)
+
             logger.info("XML to JSON conversion completed")
             return WebServiceResponse(
                 status=200,
                 message="XML converted to JSON successfully",
-                data=json_str.encode(options.encoding),
+                data=json_bytes,
                 format="json"
             )
 
@@ -239,7 +332,7 @@ class WebConverterService:
 
     async def convert_xml_to_txt(
         self,
-        file_buffer: bytes,
+        source: Union[bytes, BinaryIO],
         options: Optional[WebConversionOptions] = None
     ) -> WebServiceResponse:
         """Convert XML to TXT."""
@@ -247,14 +340,15 @@ class WebConverterService:
             if options is None:
                 options = WebConversionOptions()
 
-            xml_content = file_buffer.decode(options.encoding)
-            root = ET.fromstring(xml_content)
+            root = self._parse_xml(source, options)
             
             def xml_to_text(element):
                 text = ""
                 if element.text and element.text.strip():
                     text += element.text.strip() + "\n"
                 for child in element:
+                    if not isinstance(child.tag, str):
+                        continue
                     text += xml_to_text(child)
                 return text
             
@@ -278,7 +372,7 @@ class WebConverterService:
 
     async def convert_xml_to_csv(
         self,
-        file_buffer: bytes,
+        source: Union[bytes, BinaryIO],
         options: Optional[WebConversionOptions] = None
     ) -> WebServiceResponse:
         """Convert XML to CSV."""
@@ -286,11 +380,10 @@ class WebConverterService:
             if options is None:
                 options = WebConversionOptions()
 
-            xml_content = file_buffer.decode(options.encoding)
-            root = ET.fromstring(xml_content)
+            root = self._parse_xml(source, options)
             
             # Find all elements with the same tag (assuming tabular data)
-            elements = root.findall('.//*')
+            elements = [element for element in root.iterdescendants() if isinstance(element.tag, str)]
             if not elements:
                 elements = [root]
             
@@ -560,7 +653,7 @@ class WebConverterService:
     # CSV conversions
     async def convert_csv_to_html(
         self,
-        file_buffer: bytes,
+        source: Union[bytes, BinaryIO],
         options: Optional[WebConversionOptions] = None
     ) -> WebServiceResponse:
         """Convert CSV to HTML."""
@@ -568,15 +661,7 @@ class WebConverterService:
             if options is None:
                 options = WebConversionOptions()
 
-            csv_content = file_buffer.decode(options.encoding)
-            csv_reader = csv.DictReader(
-                io.StringIO(csv_content),
-                delimiter=options.delimiter,
-                quotechar=options.quote_char,
-                escapechar=options.escape_char
-            )
-            
-            rows = list(csv_reader)
+            rows = self._read_csv(source, options)
             if not rows:
                 return WebServiceResponse(
                     status=400,
@@ -623,7 +708,7 @@ class WebConverterService:
 
     async def convert_csv_to_xml(
         self,
-        file_buffer: bytes,
+        source: Union[bytes, BinaryIO],
         options: Optional[WebConversionOptions] = None
     ) -> WebServiceResponse:
         """Convert CSV to XML."""
@@ -631,15 +716,7 @@ class WebConverterService:
             if options is None:
                 options = WebConversionOptions()
 
-            csv_content = file_buffer.decode(options.encoding)
-            csv_reader = csv.DictReader(
-                io.StringIO(csv_content),
-                delimiter=options.delimiter,
-                quotechar=options.quote_char,
-                escapechar=options.escape_char
-            )
-            
-            rows = list(csv_reader)
+            rows = self._read_csv(source, options)
             if not rows:
                 return WebServiceResponse(
                     status=400,
@@ -677,7 +754,7 @@ class WebConverterService:
 
     async def convert_csv_to_json(
         self,
-        file_buffer: bytes,
+        source: Union[bytes, BinaryIO],
         options: Optional[WebConversionOptions] = None
     ) -> WebServiceResponse:
         """Convert CSV to JSON."""
@@ -685,15 +762,7 @@ class WebConverterService:
             if options is None:
                 options = WebConversionOptions()
 
-            csv_content = file_buffer.decode(options.encoding)
-            csv_reader = csv.DictReader(
-                io.StringIO(csv_content),
-                delimiter=options.delimiter,
-                quotechar=options.quote_char,
-                escapechar=options.escape_char
-            )
-            
-            rows = list(csv_reader)
+            rows = self._read_csv(source, options)
             if not rows:
                 return WebServiceResponse(
                     status=400,
@@ -703,13 +772,14 @@ class WebConverterService:
             
             # Convert to JSON
             json_data = {"data": rows}
-            json_str = json.dumps(json_data, indent=2 if options.pretty_print else None)
             
+            json_bytes = self._dump_json(json_data, options)
+
             logger.info("CSV to JSON conversion completed")
             return WebServiceResponse(
                 status=200,
                 message="CSV converted to JSON successfully",
-                data=json_str.encode(options.encoding),
+                data=json_bytes,
                 format="json"
             )
 
@@ -723,7 +793,7 @@ class WebConverterService:
 
     async def convert_csv_to_txt(
         self,
-        file_buffer: bytes,
+        source: Union[bytes, BinaryIO],
         options: Optional[WebConversionOptions] = None
     ) -> WebServiceResponse:
         """Convert CSV to TXT."""
@@ -731,15 +801,7 @@ class WebConverterService:
             if options is None:
                 options = WebConversionOptions()
 
-            csv_content = file_buffer.decode(options.encoding)
-            csv_reader = csv.reader(
-                io.StringIO(csv_content),
-                delimiter=options.delimiter,
-                quotechar=options.quote_char,
-                escapechar=options.escape_char
-            )
-            
-            rows = list(csv_reader)
+            rows = self._read_csv(source, options, csv.reader)
             if not rows:
                 return WebServiceResponse(
                     status=400,
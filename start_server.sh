@@ -61,5 +61,5 @@ echo "=========================================="
 echo ""
 
 # Run uvicorn with reload for development
-uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+uvicorn app.main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --no-access-log
 
@@ -0,0 +1,27 @@
+"""
+Web converter service tests.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.modules.web_converter.service import web_converter_service
+from app.modules.web_converter.types import WebConversionOptions
+
+XML_DOCUMENT = '<catalog><item name="café">Ünïcödé</item></catalog>'
+
+
+@pytest.mark.parametrize("encoding", ["latin-1", "utf_8", "cp1252", "cp437", "utf_16_le"])
+def test_xml_to_json_accepts_python_codec_names(encoding):
+    options = WebConversionOptions(encoding=encoding)
+
+    result = asyncio.run(
+        web_converter_service.convert_xml_to_json(XML_DOCUMENT.encode(encoding), options)
+    )
+
+    assert result.status == 200, result.error
+    assert json.loads(result.data.decode(encoding)) == {
+        "catalog": {"item": {"text": "Ünïcödé", "attributes": {"name": "café"}}}
+    }